@@ -7,6 +7,8 @@ from .params import FieldParam as FieldParam
 from .options import MutuallyExclusiveOption as MutuallyExclusiveOption
 from .configuration import CliConfig as CliConfig
 from .configuration import create_grpc_channel as create_grpc_channel
+from .configuration import get_grpc_channel as get_grpc_channel
+from .configuration import get_grpc_channels as get_grpc_channels
 from .exceptions import ArmoniKCLIError as ArmoniKCLIError
 from .exceptions import InternalArmoniKError as InternalArmoniKError
 from .exceptions import InternalCliError as InternalCliError
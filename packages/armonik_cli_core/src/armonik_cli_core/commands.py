@@ -2,6 +2,8 @@ from typing import List
 from click import Context
 import rich_click as click
 
+from .options import MutuallyExclusiveOption
+
 
 class EnrichedCommand(click.Command):
     """Enhanced Click command with improved error handling for missing required parameters.
@@ -11,9 +13,9 @@ class EnrichedCommand(click.Command):
     it collects all missing required parameters and displays them together in a single
     error message.
 
-    The class temporarily disables the 'required' flag on all parameters during parsing
-    to prevent early termination, then performs custom validation to identify all missing
-    required parameters at once.
+    Parsing is left to the parent class. When it fails on a missing required parameter,
+    the remaining parameters are checked in a single pass to identify all missing required
+    parameters at once. The parameters themselves are never modified.
 
     Example:
         Instead of showing:
@@ -32,9 +34,9 @@ class EnrichedCommand(click.Command):
     def parse_args(self, ctx: Context, args: List[str]):
         """Parse command-line arguments with enhanced missing parameter error handling.
 
-        This method temporarily disables the 'required' flag on all parameters to allow
-        complete parsing, then performs custom validation to identify all missing required
-        parameters and display them in a single, comprehensive error message.
+        This method lets the parent class parse the arguments and, if a required parameter
+        is missing, looks for all the other missing required parameters to display them in
+        a single, comprehensive error message.
 
         Args:
             ctx (click.Context): The Click context object containing command state.
@@ -45,46 +47,42 @@ class EnrichedCommand(click.Command):
                              a message listing all missing parameters.
 
         Note:
-            The original 'required' state of all parameters is preserved and restored
-            after parsing, ensuring the command object remains in its original state
-            regardless of whether parsing succeeds or fails.
+            Click processes the parameters passed on the command line before the others,
+            so when the first missing parameter is found, every parameter that hasn't been
+            processed yet can only get its value from the environment or its default. This
+            is also why the mutually exclusive options passed on the command line are known
+            at that point.
         """
-        # Store the original required state of the parameters
-        original_required = {param: param.required for param in self.params}
-
         try:
-            # Temporarily mark all parameters as not required
-            for param in self.params:
-                param.required = False
-
-            # Let the parent class parse the arguments
-            # This will populate ctx.params without raising MissingParameter errors
-            super().parse_args(ctx, args)
+            return super().parse_args(ctx, args)
+        except click.MissingParameter as error:
+            if error.param is None:
+                raise
 
             # Custom validation logic for multiple missing parameters
-            missing_params = []
-            for param in self.get_params(ctx):
-                # Check if the parameter was originally required and is now missing
-                if (
-                    original_required.get(param)
+            missing_params = [
+                param
+                for param in self.get_params(ctx)
+                if param is error.param
+                or (
+                    (
+                        param.is_required(ctx)
+                        if isinstance(param, MutuallyExclusiveOption)
+                        else param.required
+                    )
                     and param.name
-                    and ctx.params.get(param.name) is None
-                ):
-                    missing_params.append(param)
-
-            if missing_params:
-                # Get the error hints for all missing parameters
-                param_hints = [param.get_error_hint(ctx) for param in missing_params]
-
-                if len(missing_params) > 1:
-                    error_msg = f"Missing required options: {', '.join(param_hints)}"
-                else:
-                    error_msg = f"Missing required option: {param_hints[0]}"
-
-                # Use UsageError for better formatting of this type of error
-                raise click.UsageError(error_msg, ctx=ctx)
-
-        finally:
-            # --- IMPORTANT: Restore the original 'required' state ---
-            for param in self.params:
-                param.required = original_required.get(param, False)
+                    and param.name not in ctx.params
+                    and param.value_is_missing(param.consume_value(ctx, {})[0])
+                )
+            ]
+
+            # Get the error hints for all missing parameters
+            param_hints = [param.get_error_hint(ctx) for param in missing_params]
+
+            if len(missing_params) > 1:
+                error_msg = f"Missing required options: {', '.join(param_hints)}"
+            else:
+                error_msg = f"Missing required option: {param_hints[0]}"
+
+            # Use UsageError for better formatting of this type of error
+            raise click.UsageError(error_msg, ctx=ctx) from error
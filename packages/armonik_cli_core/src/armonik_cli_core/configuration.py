@@ -1,8 +1,10 @@
+import atexit
 import yaml
 import grpc
 
 import rich_click as click
 
+from functools import lru_cache
 from typing import Any, Callable, Dict, List, Literal, Optional, Tuple
 from pathlib import Path
 from .options import GlobalOption
@@ -11,7 +13,6 @@ from armonik.common.channel import create_channel
 
 from click import get_app_dir
 from pydantic import BaseModel, Field
-from pydantic_yaml import to_yaml_str
 
 
 def CliField(
@@ -217,9 +218,7 @@ class CliConfig:
 
         # Merge with defaults by unpacking only the set fields over the default model
         unvalidated_model = cls.ConfigModel.model_construct(**raw_data)
-        new_config_instance = cls()
-        new_config_instance._config = unvalidated_model
-        return new_config_instance
+        return cls._from_model(unvalidated_model)
 
     @classmethod
     def from_dict(cls, config_dict: dict) -> "CliConfig":
@@ -234,8 +233,19 @@ class CliConfig:
         """
 
         unvalidated_model = cls.ConfigModel.model_construct(**config_dict)
-        new_config_instance = cls()
-        new_config_instance._config = unvalidated_model
+        return cls._from_model(unvalidated_model)
+
+    @classmethod
+    def _from_model(cls, config_model: BaseModel) -> "CliConfig":
+        """
+        Wraps an existing configuration model without reading the default configuration file.
+        Args:
+            config_model (BaseModel): The configuration model to wrap.
+        Returns:
+            CliConfig: A new instance of CliConfig holding the given model
+        """
+        new_config_instance = cls.__new__(cls)
+        new_config_instance._config = config_model
         return new_config_instance
 
     def __init__(self):
@@ -245,16 +255,17 @@ class CliConfig:
         then optionally load from the default file if it exists.
         """
         self._config = self.ConfigModel.model_construct()
-        self.default_path.parent.mkdir(parents=True, exist_ok=True)
 
-        if self.default_path.exists():
+        try:
+            file_content = self.default_path.read_text()
+        except FileNotFoundError:
+            # If no file, just write defaults
+            self._write_to_file()
+        else:
             # Merge file contents into the unvalidated model
-            file_config = yaml.safe_load(self.default_path.read_text()) or {}
+            file_config = yaml.safe_load(file_content) or {}
             for k, v in file_config.items():
                 setattr(self._config, k, v)
-        else:
-            # If no file, just write defaults
-            self._write_to_file()
 
     def __repr__(self) -> str:
         return f"CliConfig({self._config!r})"
@@ -279,8 +290,13 @@ class CliConfig:
         Raises:
             IOError: If there is an error writing to the file.
         """
+        # Only needed when writing, which most invocations never do
+        from pydantic_yaml import to_yaml_str
+
+        self.default_path.parent.mkdir(parents=True, exist_ok=True)
         with open(self.default_path, "w") as f:
             f.write(to_yaml_str(self._config))
+        invalidate_cli_config()
 
     def get_table_columns(
         self, command_group: str, command: str
@@ -332,9 +348,7 @@ class CliConfig:
                 merged_dict[key] = value
 
         new_model = self.ConfigModel.model_construct(**merged_dict)
-        final_cli_conf = CliConfig()
-        final_cli_conf._config = new_model
-        return final_cli_conf
+        return self._from_model(new_model)
 
     def validate_config(self):
         """
@@ -345,24 +359,126 @@ class CliConfig:
         self._config = validated_model
 
 
+def get_cli_config() -> CliConfig:
+    """
+    Return the configuration loaded from the default configuration file.
+
+    The file is only read once per process, later calls reuse the same instance until the
+    file is written again. The returned instance is shared, use `CliConfig.layer` to derive
+    a modified configuration from it.
+    """
+    return _load_cli_config(CliConfig.default_path)
+
+
+@lru_cache(maxsize=1)
+def _load_cli_config(config_path: Path) -> CliConfig:
+    """Load the configuration, cached on the path of the default configuration file."""
+    return CliConfig()
+
+
+def invalidate_cli_config() -> None:
+    """Drop the cached configuration so that the next `get_cli_config` call reads the file again."""
+    _load_cli_config.cache_clear()
+
+
+# Maximum number of distinct shared channels opened to a same cluster
+GRPC_CHANNEL_POOL_SIZE = 4
+
+
 def create_grpc_channel(config: CliConfig) -> grpc.Channel:
     """
     Create a gRPC channel based on the configuration.
     """
-    cleaner_endpoint = config.endpoint
+    return _open_grpc_channel(
+        config.endpoint, config.certificate_authority, config.client_certificate, config.client_key
+    )
+
+
+def get_grpc_channel(config: CliConfig) -> grpc.Channel:
+    """
+    Return a gRPC channel based on the configuration, shared with every other call using the same
+    connection settings.
+
+    Unlike `create_grpc_channel`, the channel must not be closed (or used as a context manager) by
+    the caller: it stays open for the lifetime of the process and is closed when it exits. gRPC
+    channels are thread-safe, so the channel can be used concurrently.
+    """
+    return get_grpc_channels(config, 1)[0]
+
+
+def get_grpc_channels(
+    config: CliConfig, count: int = GRPC_CHANNEL_POOL_SIZE
+) -> Tuple[grpc.Channel, ...]:
+    """
+    Return a pool of distinct shared gRPC channels based on the configuration.
+
+    Each channel uses its own connection, so spreading many RPCs across them avoids queuing them
+    all behind the flow control of a single HTTP/2 connection. The first channel is the one
+    returned by `get_grpc_channel`. As with `get_grpc_channel`, the channels must not be closed
+    by the caller.
+
+    Args:
+        config: The CLI configuration holding the connection settings.
+        count: Number of channels wanted, for example the number of RPCs to issue. It is capped
+            at GRPC_CHANNEL_POOL_SIZE and at least one channel is returned.
+
+    Returns:
+        The channels of the pool.
+    """
+    return tuple(
+        _get_shared_grpc_channel(
+            config.endpoint,
+            config.certificate_authority,
+            config.client_certificate,
+            config.client_key,
+            channel_id,
+        )
+        for channel_id in range(max(1, min(count, GRPC_CHANNEL_POOL_SIZE)))
+    )
+
+
+@lru_cache(maxsize=16)
+def _get_shared_grpc_channel(
+    endpoint: str,
+    certificate_authority: Optional[Path],
+    client_certificate: Optional[Path],
+    client_key: Optional[Path],
+    channel_id: int = 0,
+) -> grpc.Channel:
+    """Open a gRPC channel once per set of connection settings and close it at exit."""
+    # gRPC shares connections between channels with identical arguments, a distinct (otherwise
+    # unused) argument gives each channel of a pool its own connection.
+    options = (("grpc.channel_id", channel_id),) if channel_id else None
+    channel = _open_grpc_channel(
+        endpoint, certificate_authority, client_certificate, client_key, options
+    )
+    atexit.register(channel.close)
+    return channel
+
+
+def _open_grpc_channel(
+    endpoint: str,
+    certificate_authority: Optional[Path],
+    client_certificate: Optional[Path],
+    client_key: Optional[Path],
+    options: Optional[Tuple[Tuple[str, Any], ...]] = None,
+) -> grpc.Channel:
+    """Open a new gRPC channel to the given endpoint, using TLS if a certificate authority is given."""
+    cleaner_endpoint = endpoint
     if cleaner_endpoint.startswith("http://"):
         cleaner_endpoint = cleaner_endpoint[7:]
     if cleaner_endpoint.endswith("/"):
         cleaner_endpoint = cleaner_endpoint[:-1]
-    if config.certificate_authority:
+    if certificate_authority:
         # Create grpc channel with tls
         channel = create_channel(
             cleaner_endpoint,
-            certificate_authority=config.certificate_authority,
-            client_certificate=config.client_certificate,
-            client_key=config.client_key,
+            certificate_authority=certificate_authority,
+            client_certificate=client_certificate,
+            client_key=client_key,
+            options=options,
         )
     else:
         # Create insecure grpc channel
-        channel = grpc.insecure_channel(cleaner_endpoint)
+        channel = grpc.insecure_channel(cleaner_endpoint, options=options)
     return channel
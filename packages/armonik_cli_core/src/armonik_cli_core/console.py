@@ -1,13 +1,18 @@
 import json
+import textwrap
 import yaml
 
-from typing import List, Dict, Tuple, Any, Union
+from operator import itemgetter
+from typing import Iterator, List, Dict, Tuple, Any, Union
 
 from rich.console import Console
 from rich.table import Table
 
 from .serialize import serialize
 
+# Same output as json.dumps(obj, sort_keys=False, indent=2), which builds a new encoder on each call
+_JSON_ENCODER = json.JSONEncoder(sort_keys=False, indent=2)
+
 
 class ArmoniKCLIConsole(Console):
     """
@@ -29,7 +34,17 @@ class ArmoniKCLIConsole(Console):
 
         Raises:
             ValueError: If `print_format` is 'table' and `table_cols` is not provided.
+
+        Note:
+            When `obj` is an iterator, it is printed as a list. In JSON and YAML, its items are
+            printed as soon as they are produced; a table needs all of them to size its columns.
         """
+        if isinstance(obj, Iterator):
+            if print_format != "table":
+                self._print_items(obj, print_format)
+                return
+            obj = list(obj)
+
         obj = serialize(obj)
 
         if print_format == "yaml":
@@ -41,9 +56,62 @@ class ArmoniKCLIConsole(Console):
                 )
             obj = self._build_table(obj, table_cols)  # type: ignore
         else:
-            obj = json.dumps(obj, sort_keys=False, indent=2)
+            obj = _JSON_ENCODER.encode(obj)
 
-        super().print(obj)
+        if isinstance(obj, str):
+            self._print_text(obj)
+        else:
+            super().print(obj)
+
+    def _print_items(self, items: Iterator[object], print_format: str) -> None:
+        """
+        Print the items of an iterator as a JSON or YAML list, one item at a time.
+
+        The output is the same as the one of the whole list printed at once.
+
+        Args:
+            items: The objects to format and print.
+            print_format: The format in which to print the objects, 'yaml' or 'json'.
+        """
+        empty = True
+        if print_format == "yaml":
+            for item in items:
+                self._print_text(yaml.dump([serialize(item)], sort_keys=False, indent=2), end="")
+                empty = False
+            self._print_text(yaml.dump([]) if empty else "")
+            return
+
+        # The separator after an item is only known once the next one is produced
+        previous = None
+        for item in items:
+            if empty:
+                self._print_text("[")
+            else:
+                self._print_text(self._indent_json(previous) + ",")
+            previous, empty = item, False
+        if empty:
+            self._print_text(json.dumps([]))
+        else:
+            self._print_text(self._indent_json(previous))
+            self._print_text("]")
+
+    def _print_text(self, text: str, end: str = "\n") -> None:
+        """
+        Print already formatted text, such as a JSON or YAML document.
+
+        Unlike `print`, the text isn't parsed for markup nor wrapped to the width of the console,
+        which would alter the document, and it is only highlighted when colors are displayed.
+
+        Args:
+            text: The text to print.
+            end: String written after the text.
+        """
+        self.out(text, end=end, highlight=self.color_system is not None)
+
+    @staticmethod
+    def _indent_json(obj: object) -> str:
+        """Dump an object in JSON, indented as an item of a list."""
+        return textwrap.indent(_JSON_ENCODER.encode(serialize(obj)), "  ")
 
     @staticmethod
     def _build_table(obj: Dict[str, Any], table_cols: List[Tuple[str, str]]) -> Table:
@@ -63,9 +131,13 @@ class ArmoniKCLIConsole(Console):
         for col_name, _ in table_cols:
             table.add_column(col_name)
 
+        # Build the row getter once, itemgetter only returns a tuple for several keys
+        keys = [key for _, key in table_cols]
+        get_row = itemgetter(*keys) if len(keys) > 1 else lambda item: (item[keys[0]],)
+
         objs = obj if isinstance(obj, List) else [obj]
         for item in objs:
-            table.add_row(*[str(item[key]) for _, key in table_cols])
+            table.add_row(*map(str, get_row(item)))
 
         return table
 
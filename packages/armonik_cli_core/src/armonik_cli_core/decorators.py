@@ -4,13 +4,25 @@ import grpc
 import rich_click as click
 
 from functools import wraps, partial
-from typing import Callable, List, Optional, Any, Tuple, Type, TypeVar, Union, cast, TYPE_CHECKING
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Any,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+    TYPE_CHECKING,
+)
 from typing_extensions import TypeAlias
 
 if TYPE_CHECKING:
     from armonik_cli_core.groups import EnrichedGroup
 
-from .configuration import CliConfig
+from .configuration import CliConfig, get_cli_config
 from .console import console
 
 from .options import GlobalOption
@@ -23,6 +35,12 @@ from armonik_cli_core.exceptions import (
 from click.core import ParameterSource
 
 
+# Error raised for the gRPC status codes that aren't reported as an ArmoniK error
+GRPC_ERRORS: Dict[grpc.StatusCode, Type[Exception]] = {
+    grpc.StatusCode.INVALID_ARGUMENT: InternalCliError,
+}
+
+
 def error_handler(func: Optional[Callable[..., Any]] = None) -> Callable[..., Any]:
     """
     Decorator to handle errors for Click commands and ensure proper error display.
@@ -49,20 +67,8 @@ def error_handler(func: Optional[Callable[..., Any]] = None) -> Callable[..., An
             if debug_mode:
                 console.print_exception()
 
-            if status_code == grpc.StatusCode.INVALID_ARGUMENT:
-                raise InternalCliError(error_details) from err
-            elif status_code == grpc.StatusCode.NOT_FOUND:
-                raise InternalArmoniKError(error_details) from err
-            elif status_code == grpc.StatusCode.ALREADY_EXISTS:
-                raise InternalArmoniKError(error_details) from err
-            elif status_code == grpc.StatusCode.DEADLINE_EXCEEDED:
-                raise InternalArmoniKError(error_details) from err
-            elif status_code == grpc.StatusCode.INTERNAL:
-                raise InternalArmoniKError(error_details) from err
-            elif status_code == grpc.StatusCode.UNKNOWN:
-                raise InternalArmoniKError(error_details) from err
-            else:
-                raise InternalArmoniKError(error_details) from err
+            error_cls = GRPC_ERRORS.get(status_code, InternalArmoniKError)
+            raise error_cls(error_details) from err
 
         except Exception as e:
             if debug_mode:
@@ -93,27 +99,30 @@ def apply_click_params(
     return command
 
 
+# Options of the configuration fields, built once and shared by every command
+GLOBAL_CONFIG_OPTIONS: Tuple[ClickOption, ...] = (
+    click.option(
+        "-c",
+        "--config",
+        "additional_config",
+        type=click.Path(exists=True, dir_okay=False),
+        required=False,
+        help="Path to additional config file.",
+        envvar="AKCONFIG",
+        cls=GlobalOption,
+    ),
+    *(
+        field_info.metadata[0]["cli_option"]
+        for field_info in CliConfig.ConfigModel.model_fields.values()
+        if len(field_info.metadata) > 0
+        and "cli_option" in field_info.metadata[0]
+        and field_info.metadata[0]["cli_option"]
+    ),
+)
+
+
 def global_config_options(command: Callable[..., Any]) -> Callable[..., Any]:
-    generated_click_options = [
-        click.option(
-            "-c",
-            "--config",
-            "additional_config",
-            type=click.Path(exists=True, dir_okay=False),
-            required=False,
-            help="Path to additional config file.",
-            envvar="AKCONFIG",
-            cls=GlobalOption,
-        )
-    ]
-    for _, field_info in CliConfig.ConfigModel.model_fields.items():
-        if (
-            len(field_info.metadata) > 0
-            and "cli_option" in field_info.metadata[0]
-            and field_info.metadata[0]["cli_option"]
-        ):
-            generated_click_options.append(field_info.metadata[0]["cli_option"])
-    return apply_click_params(command, *generated_click_options)
+    return apply_click_params(command, *GLOBAL_CONFIG_OPTIONS)
 
 
 def inject_config(func: Optional[Callable[..., Any]] = None) -> Callable[..., Any]:
@@ -143,7 +152,7 @@ def inject_config(func: Optional[Callable[..., Any]] = None) -> Callable[..., An
                 or key in ctx.obj
             }
 
-        final_config = CliConfig()
+        final_config = get_cli_config()
         if "additional_config" in kwargs and kwargs["additional_config"] is not None:
             additional_config = CliConfig.from_file(pathlib.Path(kwargs["additional_config"]))
             final_config = final_config.layer(**additional_config.model_dump(exclude_unset=True))
@@ -1,6 +1,6 @@
 import operator
 from datetime import datetime
-from functools import reduce
+from functools import lru_cache, reduce
 from pathlib import Path
 from typing import cast, Any, List, Callable, Union, Optional
 
@@ -134,10 +134,13 @@ class FilterParser:
         self.output_fields = output_fields
 
     @classmethod
+    @lru_cache(maxsize=None)
     def get_parser(cls) -> Lark:
         """
         Generate a Lark parser for the grammar associated with the filter.
 
+        The grammar is the same for every filter type, so the parser is only built once.
+
         Returns:
             A Lark parser instance.
         """
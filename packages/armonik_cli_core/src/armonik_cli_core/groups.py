@@ -1,6 +1,8 @@
+import importlib
+
 import rich_click as click
 
-from rich.traceback import Traceback
+from click import exceptions as click_exceptions
 
 from .console import console
 from .commands import EnrichedCommand
@@ -42,6 +44,9 @@ class BrokenExtension(click.RichCommand):
         Raises:
             click.ClickException: Always raised after displaying error details
         """
+        # Only needed to report a broken extension, not imported on every invocation
+        from rich.traceback import Traceback
+
         console.print(
             f"Error: The extension '{self.name}' is broken and could not be loaded.",
             fg="red",
@@ -206,13 +211,35 @@ class ExtendableGroup(click.RichGroup):
         except Exception as e:
             return BrokenExtension(name=cmd_name, error=e)
 
+    def format_help(self, ctx, formatter):
+        """
+        Populate the option groups of a root group before rendering its help.
+
+        Subcommands have their option groups populated when they are resolved, the root
+        group only needs them when its own help is displayed, so it is done here instead
+        of at import time.
+
+        Args:
+            ctx: Click context object
+            formatter: The help formatter to write to
+        """
+        if ctx.parent is None and self not in self._loaded_commands:
+            self._loaded_commands.add(self)
+
+            from armonik_cli_core.utils import populate_option_groups_incremental
+
+            populate_option_groups_incremental(self, recursive=False)
+        super().format_help(ctx, formatter)
+
     def _ensure_option_groups_populated(self, command, cmd_name):
         """
         Ensure option groups are populated for a command.
 
         Populates option groups for better help display formatting,
         tracking which commands have already been processed to avoid
-        duplicate work.
+        duplicate work. An EnrichedGroup populates the option groups of its
+        own subcommands when they are resolved, so only its own path is
+        populated here.
 
         Args:
             command (click.Command): The command to populate option groups for
@@ -227,12 +254,157 @@ class ExtendableGroup(click.RichGroup):
 
             from armonik_cli_core.utils import populate_option_groups_incremental
 
-            populate_option_groups_incremental(command, parent_path)
+            populate_option_groups_incremental(
+                command, parent_path, recursive=not isinstance(command, EnrichedGroup)
+            )
+
+
+class LazyGroup(ExtendableGroup):
+    """
+    An extendable group whose built-in subcommands are only imported when they are accessed.
+
+    Subcommands are declared through a mapping of command names to import paths of the
+    form ``"package.module:attribute"``. The module is imported the first time the command
+    is requested, so invoking one subcommand doesn't pay the import cost of all the others.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """
+        Initialize the lazy group.
+
+        Args:
+            *args: Positional arguments passed to the parent ExtendableGroup
+            **kwargs: Keyword arguments passed to the parent ExtendableGroup.
+                     'lazy_subcommands' is extracted and used as the mapping of command
+                     names to their import paths.
+        """
+        self.lazy_subcommands = kwargs.pop("lazy_subcommands", None) or {}
+        super().__init__(*args, **kwargs)
+
+    def list_commands(self, ctx):
+        """
+        Lists command names without importing the lazy subcommands.
+
+        Args:
+            ctx: Click context object
+
+        Returns:
+            list: Sorted list of all available command names
+        """
+        static_commands = sorted(set(self.commands) | set(self.lazy_subcommands))
+
+        extension_commands = self._get_extension_command_names()
+
+        self._update_command_groups(static_commands, extension_commands)
+
+        return sorted(set(static_commands + extension_commands))
+
+    def get_command(self, ctx, cmd_name):
+        """
+        Import and register a lazy subcommand on first access, then resolve it as usual.
+
+        Args:
+            ctx: Click context object
+            cmd_name (str): Name of the command to retrieve
+
+        Returns:
+            click.Command or None: The command object if found, None otherwise
+        """
+        if cmd_name not in self.commands and cmd_name in self.lazy_subcommands:
+            self.add_command(self._load_lazy_command(cmd_name), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def resolve_command(self, ctx, args):
+        """
+        Resolve a command, suggesting the close names among all the available commands.
+
+        Click only suggests the names of the commands already registered, which leaves out the
+        lazy and extension commands that haven't been loaded.
+
+        Args:
+            ctx: Click context object
+            args: The remaining command line arguments, starting with the command name
+
+        Returns:
+            tuple: The command name, the command and the remaining arguments
+
+        Raises:
+            click.UsageError: If no command has this name
+        """
+        try:
+            return super().resolve_command(ctx, args)
+        except click.UsageError as error:
+            # Only available from Click 8.4, older versions don't suggest command names
+            no_such_command = getattr(click_exceptions, "NoSuchCommand", None)
+            if no_such_command is None or not isinstance(error, no_such_command):
+                raise
+            raise no_such_command(
+                error.command_name, possibilities=self.list_commands(ctx), ctx=ctx
+            ) from None
+
+    def _load_lazy_command(self, cmd_name):
+        """
+        Import the command registered under a given name.
+
+        Args:
+            cmd_name (str): Name of the lazy command to import
+
+        Returns:
+            click.Command: The imported command object
+
+        Raises:
+            TypeError: If the import path doesn't point to a Click Command or Group
+        """
+        module_name, attribute = self.lazy_subcommands[cmd_name].split(":")
+        command = getattr(importlib.import_module(module_name), attribute)
+        if not isinstance(command, click.Command):
+            raise TypeError(f"Lazy command '{cmd_name}' did not load a Click Command or Group.")
+        return command
 
 
 class EnrichedGroup(click.RichGroup):
     """A custom group that forces all its commands to use EnrichedCommand
-    By setting the default class of commands in this group to our enriched command type."""
+    By setting the default class of commands in this group to our enriched command type.
+
+    The option groups of its subcommands are populated when they are resolved, so that
+    only the commands that are actually used pay for it."""
+
+    def __init__(self, *args, **kwargs):
+        self._populated_paths = set()
+        super().__init__(*args, **kwargs)
+
+    def get_command(self, ctx, cmd_name):
+        """
+        Override to populate the option groups of a subcommand when it is accessed.
+
+        Args:
+            ctx: Click context object
+            cmd_name (str): Name of the command to retrieve
+
+        Returns:
+            click.Command or None: The command object if found, None otherwise
+        """
+        command = super().get_command(ctx, cmd_name)
+        if command is None or ctx is None:
+            return command
+
+        # Same path as the one rich-click matches option groups against
+        names = []
+        current_ctx = ctx
+        while current_ctx is not None:
+            names.append(current_ctx.command.name)
+            current_ctx = current_ctx.parent
+        parent_path = " ".join(reversed(names))
+
+        if (parent_path, cmd_name) not in self._populated_paths:
+            self._populated_paths.add((parent_path, cmd_name))
+
+            from armonik_cli_core.utils import populate_option_groups_incremental
+
+            populate_option_groups_incremental(
+                command, parent_path, recursive=not isinstance(command, EnrichedGroup)
+            )
+        return command
 
     def command(self, name=None, **kwargs):
         """Override command method to use armonik_cli_core_command instead of rich_click.command"""
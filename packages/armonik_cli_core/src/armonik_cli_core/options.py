@@ -1,5 +1,8 @@
+import copy
+
 import rich_click as click
 
+from click.core import ParameterSource
 from typing import Any, List, Tuple, Mapping
 
 
@@ -50,6 +53,9 @@ class MutuallyExclusiveOption(click.Option):
     A custom Click option class that enforces mutual exclusivity between specified options
     and optionally requires at least one of the mutual options to be passed.
 
+    A required option is only required when none of the options it is mutually exclusive with
+    is passed.
+
     Attributes:
         mutual: A list of option names that cannot be used together with this option.
         require_one: Whether at least one of the mutually exclusive options must be provided.
@@ -63,6 +69,12 @@ class MutuallyExclusiveOption(click.Option):
             mutual_text = f" This option cannot be used together with {' or '.join(self.mutual)}."
             kwargs["help"] = f"{kwargs.get('help', '')}{mutual_text}"
 
+        if self.mutual and kwargs.get("required", False):
+            kwargs["help"] = (
+                f"{kwargs.get('help', '')} It is required unless {' or '.join(self.mutual)} "
+                "is provided."
+            )
+
         if self.require_one:
             kwargs["help"] = (
                 f"{kwargs.get('help', '')} At least one of these options must be provided."
@@ -102,4 +114,25 @@ class MutuallyExclusiveOption(click.Option):
                 f"At least one of the following options must be provided: {', '.join(self.mutual)}."
             )
 
+        if self.required and mutex:
+            # Processed as an optional option, without altering the option shared by all contexts
+            optional = copy.copy(self)
+            optional.required = False
+            return super(MutuallyExclusiveOption, optional).handle_parse_result(ctx, opts, args)
+
         return super().handle_parse_result(ctx, opts, args)
+
+    def is_required(self, ctx: click.Context) -> bool:
+        """
+        Check whether the option is required, given the options already processed in a context.
+
+        Args:
+            ctx: The Click context.
+
+        Returns:
+            Whether the option is required and none of the options it is mutually exclusive with
+            was passed on the command line.
+        """
+        return self.required and not any(
+            ctx.get_parameter_source(name) == ParameterSource.COMMANDLINE for name in self.mutual
+        )
@@ -1,16 +1,21 @@
 import dataclasses
 
 from enum import IntEnum
+from functools import lru_cache
 from datetime import datetime, timedelta
-from typing import Dict, List, Union
+from typing import Any, Callable, Dict, List, Tuple, Union
 
 from armonik_cli_core.exceptions import ArmoniKCLIError
 
 
+@lru_cache(maxsize=4096)
 def to_pascal_case(value: str) -> str:
     """
     Convert snake_case strings to PascalCase.
 
+    The same few field names are converted for every serialized object, so the conversions are
+    cached.
+
     Args:
         value: The snake_case string to be converted.
 
@@ -47,6 +52,25 @@ def serialize(obj: object) -> SerializerOutput:
     Raises:
         ArmoniKCLIError: If a dict contains non-string keys
     """
+    serializer = _SERIALIZERS.get(type(obj))
+    if serializer is None:
+        serializer = _find_serializer(obj)
+        if not isinstance(obj, type):
+            # The other objects of this type are then dispatched directly
+            _SERIALIZERS[type(obj)] = serializer
+    return serializer(obj)
+
+
+def _find_serializer(obj: object) -> Callable[[Any], SerializerOutput]:
+    """
+    Find how to serialize an object whose type isn't in the dispatch table yet.
+
+    Args:
+        obj: The object to serialize.
+
+    Returns:
+        The function serializing the object, which also applies to the other objects of its type.
+    """
     if (
         isinstance(obj, str)
         or type(obj) is int
@@ -54,34 +78,94 @@ def serialize(obj: object) -> SerializerOutput:
         or isinstance(obj, bool)
         or isinstance(obj, bytes)
     ):
-        return obj
+        return _serialize_unchanged
     elif hasattr(obj, "keys") and hasattr(obj, "values") and hasattr(obj, "items"):
         # Handle protobuf map containers and other dict-like objects
-        if all(map(lambda key: isinstance(key, str), obj.keys())):
-            return {key: serialize(val) for key, val in obj.items()}
-        else:
+        return _serialize_mapping
+    elif isinstance(obj, (timedelta, datetime)):
+        return str
+    elif isinstance(obj, list):
+        return _serialize_list
+    elif isinstance(obj, IntEnum):
+        return {member: member.name.capitalize() for member in type(obj)}.__getitem__
+    elif isinstance(obj, type):
+        return _serialize_class
+    else:
+        return _serialize_object
+
+
+def _serialize_mapping(obj: Any) -> SerializerOutput:
+    """Serialize a dict-like object, whose keys must be strings."""
+    serialized: Dict[str, SerializerOutput] = {}
+    for key, val in obj.items():
+        if not isinstance(key, str):
             raise ArmoniKCLIError(
                 "When trying to serialize object, received a dict-like object with a non-string key."
             )
-    elif isinstance(obj, timedelta):
-        return str(obj)
-    elif isinstance(obj, datetime):
-        return str(obj)
-    elif isinstance(obj, list):
-        return [serialize(elem) for elem in obj]
-    elif isinstance(obj, IntEnum):
-        return obj.name.capitalize()
-    elif obj is None:
-        return None
-    elif dataclasses.is_dataclass(obj):
-        return {
-            to_pascal_case(field.name): serialize(getattr(obj, field.name))
-            for field in dataclasses.fields(obj)
-        }
+        serialized[key] = serialize(val)
+    return serialized
+
+
+def _serialize_list(obj: List[Any]) -> SerializerOutput:
+    """Serialize the elements of a list."""
+    return [serialize(elem) for elem in obj]
+
+
+def _serialize_object(obj: object) -> SerializerOutput:
+    """Serialize an object (such as an ArmoniK entity or a dataclass) through its fields."""
+    # Typed as a plain class, mypy doesn't see type[object] as hashable for the cache
+    cls: type = type(obj)
+    return {key: serialize(getattr(obj, name)) for name, key in _serialized_fields(cls)}
+
+
+def _serialize_class(cls: type) -> SerializerOutput:
+    """Serialize a class itself through its own fields, like its instances."""
+    return {key: serialize(getattr(cls, name)) for name, key in _serialized_fields(cls)}
+
+
+def _serialize_datetime(obj: datetime) -> SerializerOutput:
+    """Serialize a datetime as `str` does, without its extra method lookup."""
+    return obj.isoformat(" ")
+
+
+def _serialize_unchanged(obj: Any) -> SerializerOutput:
+    """Return an object that is already serializable."""
+    return obj
+
+
+# Serializers by exact type. The most common types are known in advance, the others are added
+# the first time one of their objects is serialized.
+_SERIALIZERS: Dict[type, Callable[[Any], SerializerOutput]] = {
+    str: _serialize_unchanged,
+    int: _serialize_unchanged,
+    float: _serialize_unchanged,
+    bool: _serialize_unchanged,
+    bytes: _serialize_unchanged,
+    type(None): _serialize_unchanged,
+    dict: _serialize_mapping,
+    list: _serialize_list,
+    timedelta: str,
+    datetime: _serialize_datetime,
+}
+
+
+@lru_cache(maxsize=None)
+def _serialized_fields(cls: type) -> Tuple[Tuple[str, str], ...]:
+    """
+    Get the attributes to serialize for the objects of a class, computed once per class.
+
+    Dataclasses are serialized through their fields, other objects (such as ArmoniK entities)
+    through the annotated parameters of their constructor.
+
+    Args:
+        cls: The class of the objects to serialize.
+
+    Returns:
+        The names of the attributes to serialize, paired with their PascalCase keys.
+    """
+    if dataclasses.is_dataclass(cls):
+        names = [field.name for field in dataclasses.fields(cls)]
     else:
         # mypy doesn't like the fact that I'm accessing __init__ ... well too bad
-        attributes = list(obj.__init__.__annotations__.keys())  # type: ignore
-        serialized_object = {
-            to_pascal_case(att): serialize(getattr(obj, att)) for att in attributes
-        }
-        return serialized_object
+        names = list(cls.__init__.__annotations__.keys())  # type: ignore
+    return tuple((name, to_pascal_case(name)) for name in names)
@@ -1,6 +1,8 @@
 import rich_click as click
 
-from typing import Callable, Any, Dict, List, Union
+from collections import deque
+from functools import lru_cache
+from typing import Callable, Any, Deque, Dict, FrozenSet, List, Tuple, Union
 from typing_extensions import TypeAlias
 from .configuration import CliConfig
 
@@ -28,53 +30,77 @@ def apply_click_params(
     return command
 
 
+@lru_cache(maxsize=None)
+def get_long_option_names(command: Union[click.Group, click.Command]) -> Tuple[str, ...]:
+    """
+    Retrieve the longest flag of each option of a command.
+
+    The result is cached per command object, since a command's parameters don't change
+    once it has been built.
+
+    Args:
+        command: The Click command or group.
+
+    Returns:
+        A tuple containing the longest flag of each of the command's options.
+    """
+    long_options = []
+    for param in command.params:
+        if not isinstance(param, click.Option):
+            continue
+        longest = ""
+        for opt in param.opts:
+            if len(opt) > len(longest):
+                longest = opt
+        long_options.append(longest)
+    return tuple(long_options)
+
+
 def get_command_paths_with_options(
     command: Union[click.Group, click.Command], parent: str = ""
 ) -> Dict[str, List[str]]:
     """
-    Recursively retrieve all command paths and their associated options.
+    Retrieve all command paths and their associated options.
 
     Args:
         command: The root Click command or group.
-        parent: The command path prefix for recursion.
+        parent: The command path prefix of the root command.
 
     Returns:
         A dictionary where keys are command paths and values are
         strings listing their available options.
     """
     paths = {}
+    pending: Deque[Tuple[Union[click.Group, click.Command], str]] = deque([(command, parent)])
 
-    full_path = f"{parent} {command.name}".strip()
+    while pending:
+        current, current_parent = pending.popleft()
+        full_path = f"{current_parent} {current.name}".strip()
 
-    # Retrieve options as a string
-    paths[full_path] = [
-        max(opt.opts, key=len) for opt in command.params if isinstance(opt, click.Option)
-    ]
+        # Retrieve options as a string
+        paths[full_path] = list(get_long_option_names(current))
 
-    # Recurse if the command is a group
-    if isinstance(command, click.Group):
-        for subcommand in command.commands.values():
-            paths.update(get_command_paths_with_options(subcommand, full_path))
+        # Walk the subcommands if the command is a group
+        if isinstance(current, click.Group):
+            pending.extend((subcommand, full_path) for subcommand in current.commands.values())
 
     return paths
 
 
-def populate_option_groups_incremental(
-    command: Union[click.Group, click.Command], parent_path: str = ""
-) -> None:
+@lru_cache(maxsize=1)
+def get_config_option_names() -> Tuple[Tuple[str, ...], Tuple[str, ...], FrozenSet[str]]:
     """
-    Populate option groups incrementally for a specific command tree.
-    This adds to the existing OPTION_GROUPS rather than overwriting it.
-    """
-    COMMON_OPTIONS_GROUP: OptionGroupDict = {
-        "name": "Common options",
-        "options": ["--help", "--config", "--version"],
-    }
+    Retrieve the flags of the common and cluster connection options.
 
-    CLUSTER_CONFIG_OPTIONS_GROUP: OptionGroupDict = {
-        "name": "Cluster connection options",
-        "options": [],
-    }
+    The options are built from the configuration fields, which don't change during the
+    execution, so the result is computed once.
+
+    Returns:
+        The common options, the cluster connection options, and the set of both, which
+        are excluded from the command-specific options.
+    """
+    common_options = ["--help", "--config", "--version"]
+    cluster_options = []
 
     # Build the common and cluster options from config fields
     for config_field_name, config_field_info in CliConfig.ConfigModel.model_fields.items():
@@ -82,17 +108,53 @@ def populate_option_groups_incremental(
             len(config_field_info.metadata) > 0
             and config_field_info.metadata[0].get("cli_option_group", "") == "Common"
         ):
-            COMMON_OPTIONS_GROUP["options"].append(f"--{config_field_name.replace('_', '-')}")
+            common_options.append(f"--{config_field_name.replace('_', '-')}")
         elif (
             len(config_field_info.metadata) > 0
             and config_field_info.metadata[0].get("cli_option_group", "") == "ClusterConnection"
         ):
-            CLUSTER_CONFIG_OPTIONS_GROUP["options"].append(
-                f"--{config_field_name.replace('_', '-')}"
-            )
+            cluster_options.append(f"--{config_field_name.replace('_', '-')}")
+
+    return (
+        tuple(common_options),
+        tuple(cluster_options),
+        frozenset(common_options).union(cluster_options),
+    )
+
+
+def populate_option_groups_incremental(
+    command: Union[click.Group, click.Command], parent_path: str = "", recursive: bool = True
+) -> None:
+    """
+    Populate option groups incrementally for a specific command tree.
+    This adds to the existing OPTION_GROUPS rather than overwriting it.
+
+    Args:
+        command: The root Click command or group.
+        parent_path: The command path prefix of the root command.
+        recursive: Whether to populate the option groups of the whole command tree, or only
+            those of the given command.
+    """
+    common_options, cluster_options, excluded_options = get_config_option_names()
+
+    # The groups are rebuilt on each call as rich-click may edit their option lists
+    COMMON_OPTIONS_GROUP: OptionGroupDict = {
+        "name": "Common options",
+        "options": list(common_options),
+    }
+
+    CLUSTER_CONFIG_OPTIONS_GROUP: OptionGroupDict = {
+        "name": "Cluster connection options",
+        "options": list(cluster_options),
+    }
 
     # Get option paths for just this command tree
-    paths_options = get_command_paths_with_options(command, parent_path)
+    if recursive:
+        paths_options = get_command_paths_with_options(command, parent_path)
+    else:
+        paths_options = {
+            f"{parent_path} {command.name}".strip(): list(get_long_option_names(command))
+        }
 
     # Initialize OPTION_GROUPS if it doesn't exist
     if not hasattr(click.rich_click, "OPTION_GROUPS"):
@@ -105,14 +167,6 @@ def populate_option_groups_incremental(
             CLUSTER_CONFIG_OPTIONS_GROUP,
             {
                 "name": "Command-specific options",
-                "options": sorted(
-                    [
-                        opt
-                        for opt in options
-                        if opt
-                        not in COMMON_OPTIONS_GROUP["options"]
-                        + CLUSTER_CONFIG_OPTIONS_GROUP["options"]
-                    ]
-                ),
+                "options": sorted(opt for opt in options if opt not in excluded_options),
             },
         ]
@@ -1,22 +1,31 @@
 from armonik_cli import commands, __version__
 
 import armonik_cli_core as akcc
-from armonik_cli_core.utils import populate_option_groups_incremental
+from armonik_cli_core.groups import ENTRY_POINT_GROUP, LazyGroup, setup_command_groups
 
-akcc.rich_click.USE_RICH_MARKUP = True
-akcc.rich_click.USE_MARKDOWN = True
-akcc.rich_click.STYLE_ERRORS_SUGGESTION = "magenta italic"
-akcc.rich_click.ERRORS_SUGGESTION = "Try running the '--help' flag for more information."
-akcc.rich_click.ERRORS_EPILOGUE = (
-    "To find out more, visit [link=https://github.com/aneoconsulting/ArmoniK.CLI]our repo[/link]."
-)
+# Only read by rich-click when the root context is created, and inherited by every subcommand
+# context, so help and error rendering settings are applied without touching its module globals.
+RICH_HELP_CONFIG = {
+    "use_rich_markup": True,
+    "use_markdown": True,
+    "style_errors_suggestion": "magenta italic",
+    "errors_suggestion": "Try running the '--help' flag for more information.",
+    "errors_epilogue": (
+        "To find out more, visit [link=https://github.com/aneoconsulting/ArmoniK.CLI]our repo[/link]."
+    ),
+}
 
 
 @akcc.group(
-    cls=akcc.groups.ExtendableGroup,
-    entry_point_group=akcc.groups.ENTRY_POINT_GROUP,
+    cls=LazyGroup,
+    entry_point_group=ENTRY_POINT_GROUP,
+    lazy_subcommands=commands.LAZY_SUBCOMMANDS,
     name="armonik",
-    context_settings={"help_option_names": ["-h", "--help"], "auto_envvar_prefix": "AK"},
+    context_settings={
+        "help_option_names": ["-h", "--help"],
+        "auto_envvar_prefix": "AK",
+        "rich_help_config": RICH_HELP_CONFIG,
+    },
 )
 @akcc.version_option(version=__version__, prog_name="armonik")
 def cli(**kwargs) -> None:
@@ -26,15 +35,4 @@ def cli(**kwargs) -> None:
     pass
 
 
-cli.add_command(commands.extensions)
-cli.add_command(commands.sessions)
-cli.add_command(commands.tasks)
-cli.add_command(commands.partitions)
-cli.add_command(commands.results)
-cli.add_command(commands.cluster)
-cli.add_command(commands.config)
-
-akcc.groups.setup_command_groups()
-populate_option_groups_incremental(
-    cli
-)  # Note: This won't be used by plugins, just by the main CLI, should probably be brought into the main CLI later.
+setup_command_groups()
@@ -1,9 +1,12 @@
-from .sessions import sessions
-from .tasks import tasks
-from .partitions import partitions
-from .results import results
-from .cluster import cluster
-from .config import config
-from .extensions import extensions
+# Built-in commands, mapped to the import path of their group so they are only loaded when used.
+LAZY_SUBCOMMANDS = {
+    "extension": "armonik_cli.commands.extensions:extensions",
+    "session": "armonik_cli.commands.sessions:sessions",
+    "task": "armonik_cli.commands.tasks:tasks",
+    "partition": "armonik_cli.commands.partitions:partitions",
+    "result": "armonik_cli.commands.results:results",
+    "cluster": "armonik_cli.commands.cluster:cluster",
+    "config": "armonik_cli.commands.config:config",
+}
 
-__all__ = ["sessions", "tasks", "partitions", "results", "cluster", "config", "extensions"]
+__all__ = ["LAZY_SUBCOMMANDS"]
@@ -1,11 +1,32 @@
 import armonik_cli_core as akcc
 
-from armonik.client.versions import ArmoniKVersions
-from armonik.client.health_checks import ArmoniKHealthChecks
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
-from rich import print
+from functools import lru_cache
+from typing import Dict, Tuple
+
+from armonik_cli.utils import TableColumnSpec, build_table
+
+INFO_GRID_COLS: Tuple[TableColumnSpec, ...] = (
+    ("Label", {"justify": "left", "style": "cyan", "no_wrap": True}),
+    ("Value", {"style": "green", "justify": "left"}),
+)
+
+HEALTH_GRID_COLS: Tuple[TableColumnSpec, ...] = (
+    ("Service", {"style": "cyan", "justify": "left"}),
+    ("Status", {"style": "green", "justify": "left"}),
+    ("Message", {"style": "yellow", "justify": "left"}),
+)
+
+# Text and style of the status column of the health table, keyed on whether the service is healthy
+HEALTH_STATUS_DISPLAY: Dict[bool, Tuple[str, str]] = {
+    True: ("✓ Healthy", "green"),
+    False: ("✗ Unhealthy", "red"),
+}
+
+
+@lru_cache(maxsize=64)
+def prettify_service_name(service_name: str) -> str:
+    """Turn a snake_case service name into a title (e.g. 'database_service' -> 'Database Service')."""
+    return " ".join(word.capitalize() for word in service_name.split("_"))
 
 
 @akcc.group(name="cluster")
@@ -17,52 +38,53 @@ def cluster(**kwargs) -> None:
 @cluster.command(name="info", pass_config=True, auto_output="table")
 def cluster_info(config: akcc.CliConfig, **kwargs) -> None:
     """Get basic information on the ArmoniK cluster (endpoint, versions)"""
-    with akcc.create_grpc_channel(config) as channel:
-        versions_client = ArmoniKVersions(channel)
-        version_info = versions_client.list_versions()
+    from armonik.client.versions import ArmoniKVersions
+    from rich.panel import Panel
+    from rich import print
 
-        if config.output == "table":
-            grid = Table.grid(padding=(0, 1))
-            grid.add_column("Label", justify="left", style="cyan", no_wrap=True)
-            grid.add_column("Value", style="green", justify="left")
+    versions_client = ArmoniKVersions(akcc.get_grpc_channel(config))
+    version_info = versions_client.list_versions()
 
-            grid.add_row("Endpoint:", config.endpoint)
-            grid.add_row("Core Version:", version_info["core"])
-            grid.add_row("API Version:", version_info["api"])
+    if config.output == "table":
+        grid = build_table(INFO_GRID_COLS, grid=True, padding=(0, 1))
 
-            panel = Panel(grid, title="Cluster Information", border_style="blue")
-            print(panel)
-        else:
-            cluster_info = {
-                "Endpoint": config.endpoint,
-                "Versions": {"Core": version_info["core"], "API": version_info["api"]},
-            }
-            akcc.console.formatted_print(cluster_info, print_format=config.output)
+        grid.add_row("Endpoint:", config.endpoint)
+        grid.add_row("Core Version:", version_info["core"])
+        grid.add_row("API Version:", version_info["api"])
+
+        panel = Panel(grid, title="Cluster Information", border_style="blue")
+        print(panel)
+    else:
+        cluster_info = {
+            "Endpoint": config.endpoint,
+            "Versions": {"Core": version_info["core"], "API": version_info["api"]},
+        }
+        akcc.console.formatted_print(cluster_info, print_format=config.output)
 
 
 @cluster.command(name="health", pass_config=True, auto_output="table")
 def cluster_health(config: akcc.CliConfig, **kwargs) -> None:
     """Get information on the health of some components of the ArmoniK cluster"""
-    with akcc.create_grpc_channel(config) as channel:
-        health_client = ArmoniKHealthChecks(channel)
-        health_status = health_client.check_health()
-
-        if config.output == "table":
-            grid = Table.grid(padding=(0, 1))
-            grid.add_column("Service", style="cyan", justify="left")
-            grid.add_column("Status", style="green", justify="left")
-            grid.add_column("Message", style="yellow", justify="left")
-
-            for service_name, info in health_status.items():
-                status_style = "green" if info["status"] else "red"
-                status_text = "✓ Healthy" if info["status"] else "✗ Unhealthy"
-                grid.add_row(
-                    " ".join(word.capitalize() for word in service_name.split("_")),
-                    Text(status_text, style=status_style),
-                    info["message"] or "-",
-                )
-
-            panel = Panel(grid, title="Health Status", border_style="blue")
-            print(panel)
-        else:
-            akcc.console.formatted_print(health_status, print_format=config.output)
+    from armonik.client.health_checks import ArmoniKHealthChecks
+    from rich.panel import Panel
+    from rich.text import Text
+    from rich import print
+
+    health_client = ArmoniKHealthChecks(akcc.get_grpc_channel(config))
+    health_status = health_client.check_health()
+
+    if config.output == "table":
+        grid = build_table(HEALTH_GRID_COLS, grid=True, padding=(0, 1))
+
+        for service_name, info in health_status.items():
+            status_text, status_style = HEALTH_STATUS_DISPLAY[bool(info["status"])]
+            grid.add_row(
+                prettify_service_name(service_name),
+                Text(status_text, style=status_style),
+                info["message"] or "-",
+            )
+
+        panel = Panel(grid, title="Health Status", border_style="blue")
+        print(panel)
+    else:
+        akcc.console.formatted_print(health_status, print_format=config.output)
@@ -0,0 +1,4 @@
+from armonik.common import Direction
+
+# Sort directions of the API for the values of the --sort-direction option of the list commands
+SORT_DIRECTIONS = {"asc": Direction.ASC, "desc": Direction.DESC}
@@ -1,16 +1,30 @@
-from pydantic_core import PydanticUndefined
 import armonik_cli_core as akcc
 
-from rich.table import Table
-from rich.syntax import Syntax
-from rich.console import Group
-from rich.panel import Panel
+from functools import lru_cache
+from typing import Dict, Optional, Tuple, TYPE_CHECKING
 
-from armonik_cli_core.configuration import CliConfig
-from armonik_cli.utils import pretty_type
+from pydantic import BaseModel
 
-akcc.rich_click.USE_RICH_MARKUP = True
-akcc.rich_click.USE_MARKDOWN = True
+from armonik_cli_core.configuration import CliConfig, get_cli_config
+from armonik_cli.utils import TableColumnSpec, build_table, pretty_type
+
+if TYPE_CHECKING:
+    from rich.panel import Panel
+
+
+_CONFIG_FIELDS = frozenset(CliConfig.ConfigModel.model_fields)
+
+CONFIG_SHOW_COLS: Tuple[TableColumnSpec, ...] = (
+    ("Field", {"justify": "left"}),
+    ("Value", {"justify": "left"}),
+)
+
+CONFIG_LIST_COLS: Tuple[TableColumnSpec, ...] = (
+    ("Field", {"justify": "left"}),
+    ("Type", {"justify": "left"}),
+    ("Default", {"justify": "left"}),
+    ("Description", {"justify": "left"}),
+)
 
 
 @akcc.group(name="config")
@@ -27,8 +41,8 @@ def config(**kwargs) -> None:
 )
 def config_get(config: CliConfig, field: str, **kwargs) -> None:
     """Get the current CLI configuration."""
-    if field in CliConfig.ConfigModel.model_fields.keys():
-        akcc.console.print(CliConfig().get(field))
+    if field in _CONFIG_FIELDS:
+        akcc.console.print(get_cli_config().get(field))
     else:
         raise akcc.ClickException(
             f"Field {field} is not part of the configuration. Call `armonik config list` to see all available fields."
@@ -44,7 +58,7 @@ def config_get(config: CliConfig, field: str, **kwargs) -> None:
 @akcc.argument("value", type=str, required=True)
 def config_set(config: CliConfig, field: str, value: str, **kwargs) -> None:
     """Set a field in the CLI configuration."""
-    if field in CliConfig.ConfigModel.model_fields.keys():
+    if field in _CONFIG_FIELDS:
         CliConfig().set(**{field: value})
         akcc.console.print(f"Set {field} to {value}")
     else:
@@ -56,18 +70,42 @@ def config_set(config: CliConfig, field: str, value: str, **kwargs) -> None:
 @config.command(name="show", pass_config=True)
 def config_show(config: CliConfig, output, **kwargs) -> None:
     """Show the current CLI configuration."""
-    config = CliConfig()
-    config_dump = config._config.model_dump()
+    # Show the saved configuration, not the one layered with the options of this invocation
+    config = get_cli_config()
     if config.output == "table":
         # Decided to do it like this so I can have different tables per field group
-        table = Table(title="CLI Configuration")
-        table.add_column("Field", justify="left")
-        table.add_column("Value", justify="left")
-        for field, value in config_dump.items():
+        table = build_table(CONFIG_SHOW_COLS, title="CLI Configuration")
+        # Read the values straight from the model and only serialize the ones holding nested models
+        for field in CliConfig.ConfigModel.model_fields:
+            value = getattr(config._config, field)
+            if isinstance(value, (BaseModel, list, dict)):
+                value = config._config.model_dump(include={field})[field]
             table.add_row(field, str(value))
         akcc.console.print(table)
     else:
-        akcc.console.formatted_print(config_dump, print_format=output)
+        akcc.console.formatted_print(config._config.model_dump(), print_format=output)
+
+
+@lru_cache(maxsize=1)
+def get_config_field_rows() -> Tuple[Tuple[str, str, Optional[str], Optional[str]], ...]:
+    """
+    Describe the available configuration fields, computed once per process.
+
+    Returns:
+        The name, type, default value (None if the field has no default) and description of
+        each configuration field.
+    """
+    from pydantic_core import PydanticUndefined
+
+    return tuple(
+        (
+            field_name,
+            pretty_type(CliConfig.ConfigModel.__annotations__[field_name]),
+            str(details.default) if details.default is not PydanticUndefined else None,
+            details.description,
+        )
+        for field_name, details in CliConfig.ConfigModel.model_fields.items()
+    )
 
 
 @config.command(name="list", pass_config=True)
@@ -75,74 +113,68 @@ def config_list(config, **kwargs) -> None:
     """List all available configuration fields."""
     if config.output == "table":
         # Decided to do it like this so I can have different tables per field group (refactor will include grouping for yamls too)
-        available_config_fields_table = Table(title="Available configuration fields")
-        available_config_fields_table.add_column("Field", justify="left")
-        available_config_fields_table.add_column("Type", justify="left")
-        available_config_fields_table.add_column("Default", justify="left")
-        available_config_fields_table.add_column("Description", justify="left")
-        for field_name, details in CliConfig.ConfigModel.model_fields.items():
+        available_config_fields_table = build_table(
+            CONFIG_LIST_COLS, title="Available configuration fields"
+        )
+        for field_name, field_type, default, description in get_config_field_rows():
             available_config_fields_table.add_row(
-                field_name,
-                pretty_type(CliConfig.ConfigModel.__annotations__[field_name]),
-                str(details.default) if details.default != PydanticUndefined else "-",
-                details.description,
+                field_name, field_type, "-" if default is None else default, description
             )
         akcc.console.print(available_config_fields_table)
     else:
-        available_config_fields = []
-        for field_name, details in CliConfig.ConfigModel.model_fields.items():
-            available_config_fields.append(
-                {
-                    "Field": field_name,
-                    "Type": pretty_type(CliConfig.ConfigModel.__annotations__[field_name]),
-                    "Default": str(details.default) if details.default != PydanticUndefined else "",
-                    "Description": details.description,
-                }
-            )
+        available_config_fields = [
+            {
+                "Field": field_name,
+                "Type": field_type,
+                "Default": "" if default is None else default,
+                "Description": description,
+            }
+            for field_name, field_type, default, description in get_config_field_rows()
+        ]
         akcc.console.formatted_print(available_config_fields, print_format=config.output)
 
 
+# Shell configuration file to edit and command to add to it, for each supported shell
+COMPLETION_INSTRUCTIONS: Dict[str, Tuple[str, str]] = {
+    "zsh": ("~/.zshrc", 'eval "$(_ARMONIK_COMPLETE=zsh_source armonik)"'),
+    "bash": ("~/.bashrc", 'eval "$(_ARMONIK_COMPLETE=bash_source armonik)"'),
+    "fish": (
+        "~/.config/fish/completions/foo-bar.fish",
+        "_ARMONIK_COMPLETE=fish_source armonik | source",
+    ),
+}
+
+
+@lru_cache(maxsize=1)
+def get_completion_panels() -> Dict[str, "Panel"]:
+    """
+    Build the panels displaying the completion instructions, once per process.
+
+    Returns:
+        The completion instructions panel of each supported shell.
+    """
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.syntax import Syntax
+
+    return {
+        shell: Panel(
+            Group(
+                f"Add this to your [blue]{config_file}[/]\n",
+                Syntax(command, "bash", theme="monokai"),
+            ),
+            border_style="blue",
+        )
+        for shell, (config_file, command) in COMPLETION_INSTRUCTIONS.items()
+    }
+
+
 @config.command(name="completions")
 @akcc.argument(
     "shell",
-    type=akcc.Choice(["zsh", "bash", "fish"], case_sensitive=True),
+    type=akcc.Choice(list(COMPLETION_INSTRUCTIONS), case_sensitive=True),
     required=True,
 )
 def config_completions(shell, **kwargs) -> None:
     """Generate auto-completions for the ArmoniK cli"""
-    if shell == "zsh":
-        akcc.console.print(
-            Panel(
-                Group(
-                    "Add this to your [blue]~/.zshrc[/]\n",
-                    Syntax(
-                        'eval "$(_ARMONIK_COMPLETE=zsh_source armonik)"', "bash", theme="monokai"
-                    ),
-                ),
-                border_style="blue",
-            )
-        )
-    elif shell == "bash":
-        akcc.console.print(
-            Panel(
-                Group(
-                    "Add this to your [blue]~/.bashrc[/]\n",
-                    Syntax(
-                        'eval "$(_ARMONIK_COMPLETE=bash_source armonik)"', "bash", theme="monokai"
-                    ),
-                ),
-                border_style="blue",
-            )
-        )
-    elif shell == "fish":
-        akcc.console.print(
-            Panel(
-                Group(
-                    "Add this to your [blue]~/.config/fish/completions/foo-bar.fish[/]\n",
-                    Syntax(
-                        "_ARMONIK_COMPLETE=fish_source armonik | source", "bash", theme="monokai"
-                    ),
-                ),
-                border_style="blue",
-            )
-        )
+    akcc.console.print(get_completion_panels()[shell])
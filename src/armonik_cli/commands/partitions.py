@@ -4,7 +4,9 @@ from typing import List, Optional, Union
 
 from armonik.client.partitions import ArmoniKPartitions
 from armonik.common.filter import Filter, PartitionFilter
-from armonik.common import Partition, Direction
+from armonik.common import Partition
+
+from armonik_cli.commands.common import SORT_DIRECTIONS
 
 
 @akcc.group(name="partition")
@@ -58,9 +60,7 @@ def partition_list(
             total, partitions = partitions_client.list_partitions(
                 partition_filter=filter_with,
                 sort_field=Partition.id if sort_by is None else sort_by,
-                sort_direction=Direction.ASC
-                if sort_direction.capitalize() == "ASC"
-                else Direction.DESC,
+                sort_direction=SORT_DIRECTIONS[sort_direction.lower()],
                 page=curr_page,
                 page_size=page_size,
             )
@@ -1,15 +1,28 @@
+import base64
 import logging
 import pathlib
 import grpc
 import armonik_cli_core as akcc
 
-from typing import IO, List, Optional, Union
-from collections import defaultdict
+from typing import IO, Dict, Iterable, List, Optional, Tuple, Union
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache, reduce
+from itertools import groupby
+from operator import attrgetter, or_
 
 from armonik.client.results import ArmoniKResults
-from armonik.common import Result, Direction
+from armonik.common import Result
 from armonik.common.filter import PartitionFilter, Filter
 
+from armonik_cli.commands.common import SORT_DIRECTIONS
+from armonik_cli.utils import iter_all_pages, lookup_by_ids, map_file
+
+
+# Maximum number of result files uploaded at the same time
+MAX_UPLOAD_WORKERS = 8
+# Result files up to this size are sent with the creation request, larger ones are streamed
+MAX_INLINE_FILE_SIZE = 1024 * 1024
+
 
 @akcc.group(name="result")
 def results(**kwargs) -> None:
@@ -17,6 +30,83 @@ def results(**kwargs) -> None:
     pass
 
 
+@lru_cache(maxsize=8)
+def get_results_client(channel: grpc.Channel) -> ArmoniKResults:
+    """
+    Get a results client for a shared channel, built once per channel.
+
+    Args:
+        channel: A shared gRPC channel, as returned by `akcc.get_grpc_channel(s)`.
+
+    Returns:
+        The results client using this channel.
+    """
+    return ArmoniKResults(channel)
+
+
+def lookup_results(config: akcc.CliConfig, result_ids: List[str]) -> List["Future[Result]"]:
+    """
+    Get several results with as few calls as possible, spread over a pool of gRPC channels.
+
+    Args:
+        config: The CLI configuration.
+        result_ids: IDs of the results to get.
+
+    Returns:
+        The completed lookups, in the order of the given IDs, as returned by `lookup_by_ids`.
+    """
+    results_clients = [
+        get_results_client(channel) for channel in akcc.get_grpc_channels(config, len(result_ids))
+    ]
+
+    def list_batch(index: int, batch: List[str]) -> List[Result]:
+        _, batch_results = results_clients[index % len(results_clients)].list_results(
+            result_filter=reduce(or_, (Result.result_id == result_id for result_id in batch)),
+            page=0,
+            page_size=len(batch),
+        )
+        return batch_results
+
+    def get_result(index: int, result_id: str) -> Result:
+        return results_clients[index % len(results_clients)].get_result(result_id)
+
+    return lookup_by_ids(result_ids, list_batch, get_result, "result_id")
+
+
+def upload_file_data(
+    config: akcc.CliConfig, session_id: str, result_files: Dict[str, str]
+) -> Dict[str, BaseException]:
+    """
+    Upload the data of several results from files, concurrently and spread over a pool of gRPC
+    channels.
+
+    Args:
+        config: The CLI configuration.
+        session_id: ID of the session the results belong to.
+        result_files: Mapping of the result IDs to the path of the file holding their data.
+
+    Returns:
+        The errors of the failed uploads, by result ID. The other uploads are still carried out.
+    """
+    results_clients = [
+        get_results_client(channel) for channel in akcc.get_grpc_channels(config, len(result_files))
+    ]
+
+    def upload(index: int, result_id: str) -> None:
+        with open(result_files[result_id], "rb") as file, map_file(file) as data:
+            results_clients[index % len(results_clients)].upload_result_data(
+                result_id, session_id, data
+            )
+
+    with ThreadPoolExecutor(max_workers=min(MAX_UPLOAD_WORKERS, len(result_files))) as executor:
+        uploads = {
+            result_id: executor.submit(upload, index, result_id)
+            for index, result_id in enumerate(result_files)
+        }
+    errors = {result_id: upload.exception() for result_id, upload in uploads.items()}
+    return {result_id: error for result_id, error in errors.items() if error is not None}
+
+
 @results.command(name="list", pass_config=True, auto_output="table")
 @akcc.option(
     "-f",
@@ -52,43 +142,39 @@ def result_list(
     page: int,
     page_size: int,
     **kwargs,
-) -> None:
+) -> Optional[Iterable[Result]]:
     """List the results of an ArmoniK cluster given <SESSION-ID>."""
-    with akcc.create_grpc_channel(config) as channel:
-        results_client = ArmoniKResults(channel)
-        curr_page = page if page > 0 else 0
-        results_list = []
-        while True:
-            total, results = results_client.list_results(
-                result_filter=filter_with,
-                sort_field=Result.name if sort_by is None else sort_by,
-                sort_direction=Direction.ASC
-                if sort_direction.capitalize() == "ASC"
-                else Direction.DESC,
-                page=curr_page,
-                page_size=page_size,
-            )
+    # Pages are fetched concurrently, spread over several connections
+    results_clients = [get_results_client(channel) for channel in akcc.get_grpc_channels(config)]
+    sort_field = Result.name if sort_by is None else sort_by
+    direction = SORT_DIRECTIONS[sort_direction.lower()]
 
-            results_list += results
-            if page > 0 or len(results_list) >= total:
-                break
-            curr_page += 1
+    def list_page(page_number: int) -> Tuple[int, List[Result]]:
+        return results_clients[page_number % len(results_clients)].list_results(
+            result_filter=filter_with,
+            sort_field=sort_field,
+            sort_direction=direction,
+            page=page_number,
+            page_size=page_size,
+        )
+
+    results_list: Iterable[Result]
+    if page > 0:
+        total, results_list = list_page(page)
+    else:
+        # Results are printed while the next pages are still being fetched
+        total, results_list = iter_all_pages(list_page, page_size)
 
     if total > 0:
-        return results
+        return results_list
+    return None
 
 
 @results.command(name="get", pass_config=True, auto_output="table")
 @akcc.argument("result-ids", type=str, nargs=-1, required=True)
 def result_get(config: akcc.CliConfig, result_ids: List[str], **kwargs) -> Optional[List[Result]]:
     """Get details about multiple results given their RESULT_IDs."""
-    with akcc.create_grpc_channel(config) as channel:
-        results_client = ArmoniKResults(channel)
-        results = []
-        for result_id in result_ids:
-            result = results_client.get_result(result_id)
-            results.append(result)
-        return results
+    return [future.result() for future in lookup_results(config, result_ids)]
 
 
 @results.command(name="create", pass_config=True, auto_output="table")
@@ -115,32 +201,60 @@ def result_create(
 ) -> Optional[List[Result]]:
     """Create result objects in a session with id SESSION_ID."""
     results_with_data = dict()
+    results_from_files = dict()
     metadata_only = []
     for res in result_definitions:
         if res.type == "bytes":
             results_with_data[res.name] = res.data
         elif res.type == "file":
-            with open(res.data, "rb") as file:
-                results_with_data[res.name] = file.read()
+            if pathlib.Path(res.data).stat().st_size <= MAX_INLINE_FILE_SIZE:
+                with open(res.data, "rb") as file:
+                    results_with_data[res.name] = file.read()
+            else:
+                # The file is streamed once its result is created instead of being loaded in memory
+                results_from_files[res.name] = res.data
+                metadata_only.append(res.name)
         elif res.type == "nodata":
             metadata_only.append(res.name)
 
-    with akcc.create_grpc_channel(config) as channel:
-        results_client = ArmoniKResults(channel)
-        # Create metadata-only results
-        created_results = []
-        if len(metadata_only) > 0:
-            created_results_metadata_only = results_client.create_results_metadata(
-                result_names=metadata_only, session_id=session_id
+    results_client = get_results_client(akcc.get_grpc_channel(config))
+    # Create metadata-only results
+    created_results = []
+    if metadata_only:
+        created_results_metadata_only = results_client.create_results_metadata(
+            result_names=metadata_only, session_id=session_id
+        )
+        if results_from_files:
+            # Upload the data of the results given by a file, several at a time
+            failed_uploads = upload_file_data(
+                config,
+                session_id,
+                {
+                    created_results_metadata_only[name].result_id: path
+                    for name, path in results_from_files.items()
+                },
             )
-            created_results += created_results_metadata_only.values()
-        # Create results with data
-        if len(results_with_data.keys()) > 0:
-            created_results_data = results_client.create_results(
-                results_data=results_with_data, session_id=session_id
+            if failed_uploads:
+                akcc.console.print(
+                    "[red]These results were created but their data couldn't be uploaded: "
+                    f"{', '.join(failed_uploads)}[/red]"
+                )
+                raise next(iter(failed_uploads.values()))
+            # Get them again now that their data is uploaded
+            uploaded_results = lookup_results(
+                config,
+                [created_results_metadata_only[name].result_id for name in results_from_files],
             )
-            created_results += created_results_data.values()
-        return created_results
+            for name, uploaded_result in zip(results_from_files, uploaded_results):
+                created_results_metadata_only[name] = uploaded_result.result()
+        created_results += created_results_metadata_only.values()
+    # Create results with data
+    if results_with_data:
+        created_results_data = results_client.create_results(
+            results_data=results_with_data, session_id=session_id
+        )
+        created_results += created_results_data.values()
+    return created_results
 
 
 @results.command(name="download-data", pass_config=True, auto_output="table")
@@ -193,33 +307,66 @@ def results_download_data(
     **kwargs,
 ):
     """Download a list of results from your cluster."""
-    with akcc.create_grpc_channel(config) as channel:
-        results_client = ArmoniKResults(channel)
-        downloaded_results = []
-        for result_id in result_ids:
-            try:
-                data = results_client.download_result_data(result_id, session_id)
-            except grpc.RpcError as e:
-                if skip_not_found and e.code() == grpc.StatusCode.NOT_FOUND:
-                    continue
-                else:
-                    raise e
-            downloaded_result_obj = {"ResultId": result_id}
-            if std_out:
-                downloaded_result_obj["Data"] = data
-                downloaded_result_table = [("ResultId", "ResultId"), ("Data", "Data")]
+    results_client = get_results_client(akcc.get_grpc_channel(config))
+    downloaded_results = []
+    for result_id in result_ids:
+        try:
+            data = results_client.download_result_data(result_id, session_id)
+        except grpc.RpcError as e:
+            if skip_not_found and e.code() == grpc.StatusCode.NOT_FOUND:
+                continue
             else:
-                result_download_path = download_path / (result_id + suffix)
-                downloaded_result_table = [("ResultId", "ResultId"), ("Path", "Path")]
-                with open(result_download_path, "wb") as result_file_handle:
-                    result_file_handle.write(data)
-                    downloaded_result_obj["Path"] = str(result_download_path)
-            downloaded_results.append(downloaded_result_obj)
-        akcc.console.formatted_print(
-            downloaded_result_obj,
-            print_format=config.output,
-            table_cols=downloaded_result_table,
-        )
+                raise e
+        downloaded_result_obj = {"ResultId": result_id}
+        if std_out:
+            downloaded_result_obj["Data"] = data
+            downloaded_result_table = [("ResultId", "ResultId"), ("Data", "Data")]
+        else:
+            result_download_path = download_path / (result_id + suffix)
+            downloaded_result_table = [("ResultId", "ResultId"), ("Path", "Path")]
+            with open(result_download_path, "wb") as result_file_handle:
+                result_file_handle.write(data)
+                downloaded_result_obj["Path"] = str(result_download_path)
+        downloaded_results.append(downloaded_result_obj)
+    akcc.console.formatted_print(
+        downloaded_result_obj,
+        print_format=config.output,
+        table_cols=downloaded_result_table,
+    )
+
+
+def decode_hex(
+    ctx: akcc.Context, param: akcc.Parameter, value: Union[str, None]
+) -> Union[bytes, None]:
+    """
+    Decode data given as a hexadecimal string.
+
+    Raises:
+        akcc.BadParameter: If the value isn't a valid hexadecimal string.
+    """
+    if value is None:
+        return None
+    try:
+        return bytes.fromhex(value)
+    except ValueError as error:
+        raise akcc.BadParameter(f"Invalid hexadecimal data: {error}", ctx, param)
+
+
+def decode_base64(
+    ctx: akcc.Context, param: akcc.Parameter, value: Union[str, None]
+) -> Union[bytes, None]:
+    """
+    Decode data given as a base64 encoded string, rejecting characters outside of the alphabet.
+
+    Raises:
+        akcc.BadParameter: If the value isn't a valid base64 encoded string.
+    """
+    if value is None:
+        return None
+    try:
+        return base64.b64decode(value, validate=True)
+    except ValueError as error:
+        raise akcc.BadParameter(f"Invalid base64 data: {error}", ctx, param)
 
 
 @results.command(name="upload-data", pass_config=True, auto_output="json")
@@ -229,33 +376,71 @@ def results_download_data(
     "--from-bytes",
     type=str,
     cls=akcc.MutuallyExclusiveOption,
-    mutual=["from_file"],
+    mutual=["from_hex", "from_base64", "from_file", "from_opaque_id"],
+    require_one=True,
+)
+@akcc.option(
+    "--from-hex",
+    type=str,
+    callback=decode_hex,
+    cls=akcc.MutuallyExclusiveOption,
+    mutual=["from_bytes", "from_base64", "from_file", "from_opaque_id"],
+    require_one=True,
+    help="Data to upload, given as a hexadecimal string.",
+)
+@akcc.option(
+    "--from-base64",
+    type=str,
+    callback=decode_base64,
+    cls=akcc.MutuallyExclusiveOption,
+    mutual=["from_bytes", "from_hex", "from_file", "from_opaque_id"],
     require_one=True,
+    help="Data to upload, given as a base64 encoded string.",
 )
 @akcc.option(
     "--from-file",
     type=akcc.File("rb"),
     cls=akcc.MutuallyExclusiveOption,
-    mutual=["from_bytes"],
+    mutual=["from_bytes", "from_hex", "from_base64", "from_opaque_id"],
     require_one=True,
 )
+@akcc.option(
+    "--from-opaque-id",
+    type=str,
+    cls=akcc.MutuallyExclusiveOption,
+    mutual=["from_bytes", "from_hex", "from_base64", "from_file"],
+    require_one=True,
+    help=(
+        "Opaque ID of data already stored in the object storage of the cluster. Only this ID is "
+        "sent, which avoids transferring large data through the control plane."
+    ),
+)
 def result_upload_data(
     config: akcc.CliConfig,
     session_id: str,
     result_id: Union[str, None],
     from_bytes: Union[str, None],
+    from_hex: Union[bytes, None],
+    from_base64: Union[bytes, None],
     from_file: IO[bytes],
+    from_opaque_id: Union[str, None],
     **kwargs,
 ) -> None:
     """Upload data for a result separately"""
-    with akcc.create_grpc_channel(config) as channel:
-        results_client = ArmoniKResults(channel)
-        if from_bytes:
-            result_data = bytes(from_bytes, encoding="utf-8")
-        if from_file:
-            result_data = from_file.read()
-
-        results_client.upload_result_data(result_id, session_id, result_data)
+    results_client = get_results_client(akcc.get_grpc_channel(config))
+    if from_bytes:
+        results_client.upload_result_data(result_id, session_id, from_bytes.encode("utf-8"))
+    if from_hex:
+        results_client.upload_result_data(result_id, session_id, from_hex)
+    if from_base64:
+        results_client.upload_result_data(result_id, session_id, from_base64)
+    if from_file:
+        # Map the file so that it is read chunk by chunk as it is uploaded
+        with map_file(from_file) as result_data:
+            results_client.upload_result_data(result_id, session_id, result_data)
+    if from_opaque_id:
+        # The data is already in the object storage, only reference it
+        results_client.import_data(session_id, [(result_id, from_opaque_id.encode())])
 
 
 @results.command(name="delete-data", pass_config=True, auto_output="json")
@@ -270,31 +455,53 @@ def result_upload_data(
     is_flag=True,
     help="Skips results that haven't been found when trying to delete them.",
 )
+@akcc.option(
+    "--session-id",
+    type=str,
+    required=False,
+    help=(
+        "ID of the session all the results belong to. When used with --confirm, the results "
+        "are deleted directly without being looked up first. Ignored without --confirm, the "
+        "session of each result is then the one it is found in."
+    ),
+)
 def result_delete_data(
     config: akcc.CliConfig,
     logger: logging.Logger,
     result_ids: List[str],
     confirm: bool,
     skip_not_found: bool,
+    session_id: Optional[str],
     **kwargs,
 ) -> None:
     """Delete the data of multiple results given their RESULT_IDs."""
-    with akcc.create_grpc_channel(config) as channel:
-        results_client = ArmoniKResults(channel)
-        session_result_mapping = defaultdict(list)
-        for result_id in result_ids:
-            try:
-                result = results_client.get_result(result_id)
-            except grpc.RpcError as e:
-                if skip_not_found and e.code() == grpc.StatusCode.NOT_FOUND:
-                    logger.warning("Couldn't find result with id=%s, skipping...", result_id)
-                    continue
-                else:
-                    raise e
-            if confirm or akcc.confirm(
-                f"Are you sure you want to delete the result data of task [{result.owner_task_id}] in session [{result.session_id}]",
-                abort=False,
-            ):
-                session_result_mapping[result.session_id].append(result_id)
-        for session_id, result_ids_for_session in session_result_mapping.items():
-            results_client.delete_result_data(result_ids_for_session, session_id)
+    if session_id is not None and confirm:
+        # Nothing to ask nor to find out about the results, delete them right away
+        get_results_client(akcc.get_grpc_channel(config)).delete_result_data(
+            list(result_ids), session_id
+        )
+        return
+    results_to_delete = []
+    for result_id, future in zip(result_ids, lookup_results(config, result_ids)):
+        try:
+            result = future.result()
+        except grpc.RpcError as e:
+            if skip_not_found and e.code() == grpc.StatusCode.NOT_FOUND:
+                logger.warning("Couldn't find result with id=%s, skipping...", result_id)
+                continue
+            else:
+                raise e
+        if confirm or akcc.confirm(
+            f"Are you sure you want to delete the result data of task [{result.owner_task_id}] in session [{result.session_id}]",
+            abort=False,
+        ):
+            results_to_delete.append(result)
+    results_client = get_results_client(akcc.get_grpc_channel(config))
+    # The sort is stable, so the results of a session stay in the order they were given
+    results_to_delete.sort(key=attrgetter("session_id"))
+    for result_session_id, session_results in groupby(
+        results_to_delete, key=attrgetter("session_id")
+    ):
+        results_client.delete_result_data(
+            [result.result_id for result in session_results], result_session_id
+        )
@@ -2,13 +2,23 @@ import armonik_cli_core as akcc
 import logging
 import grpc
 
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import timedelta
-from typing import List, Optional, Tuple, Union
+from functools import lru_cache, reduce
+from operator import or_
+from typing import Any, Iterable, List, Optional, Tuple, Union
 
 from armonik.client.sessions import ArmoniKSessions
-from armonik.common import Session, TaskOptions, Direction
+from armonik.common import Session, TaskOptions
 from armonik.common.filter import SessionFilter, Filter
 
+from armonik_cli.commands.common import SORT_DIRECTIONS
+from armonik_cli.utils import iter_all_pages, lookup_by_ids
+
+
+# Maximum number of session calls made at the same time
+MAX_SESSION_WORKERS = 32
+
 
 @akcc.group(name="session")
 def sessions(**kwargs) -> None:
@@ -16,6 +26,135 @@ def sessions(**kwargs) -> None:
     pass
 
 
+@lru_cache(maxsize=8)
+def get_sessions_client(channel: grpc.Channel) -> ArmoniKSessions:
+    """
+    Get a sessions client for a shared channel, built once per channel.
+
+    Args:
+        channel: A shared gRPC channel, as returned by `akcc.get_grpc_channel(s)`.
+
+    Returns:
+        The sessions client using this channel.
+    """
+    return ArmoniKSessions(channel)
+
+
+def get_sessions_clients(config: akcc.CliConfig, count: int) -> List[ArmoniKSessions]:
+    """
+    Get the session clients of a pool of shared gRPC channels.
+
+    Args:
+        config: The CLI configuration.
+        count: Number of calls to spread over the pool.
+
+    Returns:
+        The session clients, one per channel of the pool.
+    """
+    return [get_sessions_client(channel) for channel in akcc.get_grpc_channels(config, count)]
+
+
+def call_on_sessions(
+    config: akcc.CliConfig, session_ids: List[str], method: str, **kwargs: Any
+) -> List["Future[Session]"]:
+    """
+    Call a method of the session client concurrently for several sessions.
+
+    Args:
+        config: The CLI configuration.
+        session_ids: IDs of the sessions to call the method for.
+        method: Name of the ArmoniKSessions method to call.
+        **kwargs: Additional arguments passed to each call.
+
+    Returns:
+        The completed calls, in the order of the given IDs. A failed call raises its error
+        when its result is retrieved.
+
+    Raises:
+        KeyboardInterrupt: If interrupted, once the calls already in progress are done. The
+            calls that haven't started yet are not made.
+    """
+    if not session_ids:
+        return []
+    sessions_clients = get_sessions_clients(config, len(session_ids))
+    with ThreadPoolExecutor(max_workers=min(MAX_SESSION_WORKERS, len(session_ids))) as executor:
+        futures = [
+            executor.submit(
+                getattr(sessions_clients[index % len(sessions_clients)], method),
+                session_id=session_id,
+                **kwargs,
+            )
+            for index, session_id in enumerate(session_ids)
+        ]
+        try:
+            wait(futures)
+        except KeyboardInterrupt:
+            # Only wait for the calls already sent, the others are dropped
+            for future in futures:
+                future.cancel()
+            raise
+        return futures
+
+
+def lookup_sessions(config: akcc.CliConfig, session_ids: List[str]) -> List["Future[Session]"]:
+    """
+    Get several sessions with as few calls as possible, spread over a pool of gRPC channels.
+
+    Args:
+        config: The CLI configuration.
+        session_ids: IDs of the sessions to get.
+
+    Returns:
+        The completed lookups, in the order of the given IDs, as returned by `lookup_by_ids`.
+    """
+    sessions_clients = get_sessions_clients(config, len(session_ids))
+
+    def list_batch(index: int, batch: List[str]) -> List[Session]:
+        _, batch_sessions = sessions_clients[index % len(sessions_clients)].list_sessions(
+            session_filter=reduce(or_, (Session.session_id == session_id for session_id in batch)),
+            page=0,
+            page_size=len(batch),
+        )
+        return batch_sessions
+
+    def get_session(index: int, session_id: str) -> Session:
+        return sessions_clients[index % len(sessions_clients)].get_session(session_id=session_id)
+
+    return lookup_by_ids(session_ids, list_batch, get_session, "session_id")
+
+
+def confirm_sessions(session_ids: List[str], action: str, confirm: bool) -> List[str]:
+    """
+    Ask for the confirmation of an action on several sessions.
+
+    When several sessions are given, the action is first confirmed for all of them at once. If
+    this is refused, it is then confirmed for each session.
+
+    Args:
+        session_ids: IDs of the sessions to act on.
+        action: Description of the action, completing "Are you sure you want to".
+        confirm: Whether the action was already confirmed for all the sessions.
+
+    Returns:
+        The IDs of the sessions the action was confirmed for.
+    """
+    if confirm or (
+        len(session_ids) > 1
+        and akcc.confirm(
+            f"Are you sure you want to {action} the {len(session_ids)} sessions",
+            abort=False,
+        )
+    ):
+        return list(session_ids)
+    return [
+        session_id
+        for session_id in session_ids
+        if akcc.confirm(
+            f"Are you sure you want to {action} the session with id [{session_id}]", abort=False
+        )
+    ]
+
+
 @sessions.command(name="list", pass_config=True, auto_output="table")
 @akcc.option(
     "-f",
@@ -51,26 +190,28 @@ def session_list(
     page: int,
     page_size: int,
     **kwargs,
-) -> Optional[List[Session]]:
+) -> Optional[Iterable[Session]]:
     """List the sessions of an ArmoniK cluster."""
-    with akcc.create_grpc_channel(config) as channel:
-        sessions_client = ArmoniKSessions(channel)
-        curr_page = page if page > 0 else 0
-        session_list = []
-        while True:
-            total, sessions = sessions_client.list_sessions(
-                session_filter=filter_with,
-                sort_field=Session.session_id if sort_by is None else sort_by,
-                sort_direction=Direction.ASC
-                if sort_direction.capitalize() == "ASC"
-                else Direction.DESC,
-                page=curr_page,
-                page_size=page_size,
-            )
-            session_list += sessions
-            if page > 0 or len(session_list) >= total:
-                break
-            curr_page += 1
+    # Pages are fetched concurrently, spread over several connections
+    sessions_clients = [get_sessions_client(channel) for channel in akcc.get_grpc_channels(config)]
+    sort_field = Session.session_id if sort_by is None else sort_by
+    direction = SORT_DIRECTIONS[sort_direction.lower()]
+
+    def list_page(page_number: int) -> Tuple[int, List[Session]]:
+        return sessions_clients[page_number % len(sessions_clients)].list_sessions(
+            session_filter=filter_with,
+            sort_field=sort_field,
+            sort_direction=direction,
+            page=page_number,
+            page_size=page_size,
+        )
+
+    session_list: Iterable[Session]
+    if page > 0:
+        total, session_list = list_page(page)
+    else:
+        # Sessions are printed while the next pages are still being fetched
+        total, session_list = iter_all_pages(list_page, page_size)
 
     if total > 0:
         return session_list
@@ -83,13 +224,7 @@ def session_get(
     config: akcc.CliConfig, session_ids: List[str], **kwargs
 ) -> Optional[List[Session]]:
     """Get details of a given session."""
-    with akcc.create_grpc_channel(config) as channel:
-        sessions_client = ArmoniKSessions(channel)
-        sessions = []
-        for session_id in session_ids:
-            session = sessions_client.get_session(session_id=session_id)
-            sessions.append(session)
-        return sessions
+    return [future.result() for future in lookup_sessions(config, session_ids)]
 
 
 @sessions.command(name="create", pass_config=True, auto_output="json")
@@ -174,25 +309,24 @@ def session_create(
     **kwargs,
 ) -> Optional[Session]:
     """Create a new session."""
-    with akcc.create_grpc_channel(config) as channel:
-        sessions_client = ArmoniKSessions(channel)
-        session_id = sessions_client.create_session(
-            default_task_options=TaskOptions(
-                max_duration=max_duration,
-                priority=priority,
-                max_retries=max_retries,
-                partition_id=default_partition,
-                application_name=application_name,
-                application_version=application_version,
-                application_namespace=application_namespace,
-                application_service=application_service,
-                engine_type=engine_type,
-                options=dict(option) if option else None,
-            ),
-            partition_ids=partition if partition else [default_partition],
-        )
-        session = sessions_client.get_session(session_id=session_id)
-        return session
+    sessions_client = get_sessions_client(akcc.get_grpc_channel(config))
+    session_id = sessions_client.create_session(
+        default_task_options=TaskOptions(
+            max_duration=max_duration,
+            priority=priority,
+            max_retries=max_retries,
+            partition_id=default_partition,
+            application_name=application_name,
+            application_version=application_version,
+            application_namespace=application_namespace,
+            application_service=application_service,
+            engine_type=engine_type,
+            options=dict(option) if option else None,
+        ),
+        partition_ids=partition if partition else [default_partition],
+    )
+    session = sessions_client.get_session(session_id=session_id)
+    return session
 
 
 @sessions.command(name="cancel", pass_config=True, auto_output="json")
@@ -216,24 +350,21 @@ def session_cancel(
     **kwargs,
 ) -> Optional[List[Session]]:
     """Cancel sessions."""
-    with akcc.create_grpc_channel(config) as channel:
-        sessions_client = ArmoniKSessions(channel)
-        cancelled_sessions = []
-        for session_id in session_ids:
-            if confirm or akcc.confirm(
-                f"Are you sure you want to cancel the session with id [{session_id}]",
-                abort=False,
-            ):
-                try:
-                    session = sessions_client.cancel_session(session_id=session_id)
-                    cancelled_sessions.append(session)
-                except grpc.RpcError as e:
-                    if skip_not_found and e.code() == grpc.StatusCode.NOT_FOUND:
-                        logger.warning("Couldn't find session with id=%s, skipping...", session_id)
-                        continue
-                    else:
-                        raise e
-        return cancelled_sessions
+    # Ask for every confirmation first, then send the calls concurrently
+    confirmed_ids = confirm_sessions(session_ids, "cancel", confirm)
+    cancelled_sessions = []
+    for session_id, future in zip(
+        confirmed_ids, call_on_sessions(config, confirmed_ids, "cancel_session")
+    ):
+        try:
+            cancelled_sessions.append(future.result())
+        except grpc.RpcError as e:
+            if skip_not_found and e.code() == grpc.StatusCode.NOT_FOUND:
+                logger.warning("Couldn't find session with id=%s, skipping...", session_id)
+                continue
+            else:
+                raise e
+    return cancelled_sessions
 
 
 @sessions.command(name="pause", pass_config=True, auto_output="json")
@@ -242,13 +373,7 @@ def session_pause(
     config: akcc.CliConfig, session_ids: List[str], **kwargs
 ) -> Optional[List[Session]]:
     """Pause sessions."""
-    with akcc.create_grpc_channel(config) as channel:
-        sessions_client = ArmoniKSessions(channel)
-        paused_sessions = []
-        for session_id in session_ids:
-            session = sessions_client.pause_session(session_id=session_id)
-            paused_sessions.append(session)
-        return paused_sessions
+    return [future.result() for future in call_on_sessions(config, session_ids, "pause_session")]
 
 
 @sessions.command(name="resume", pass_config=True, auto_output="json")
@@ -257,13 +382,7 @@ def session_resume(
     config: akcc.CliConfig, session_ids: List[str], **kwargs
 ) -> Optional[List[Session]]:
     """Resume sessions."""
-    with akcc.create_grpc_channel(config) as channel:
-        sessions_client = ArmoniKSessions(channel)
-        resumed_sessions = []
-        for session_id in session_ids:
-            session = sessions_client.resume_session(session_id=session_id)
-            resumed_sessions.append(session)
-        return resumed_sessions
+    return [future.result() for future in call_on_sessions(config, session_ids, "resume_session")]
 
 
 @sessions.command(name="close", pass_config=True, auto_output="json")
@@ -287,24 +406,21 @@ def session_close(
     **kwargs,
 ) -> Optional[List[Session]]:
     """Close sessions."""
-    with akcc.create_grpc_channel(config) as channel:
-        sessions_client = ArmoniKSessions(channel)
-        closed_sessions = []
-        for session_id in session_ids:
-            if confirm or akcc.confirm(
-                f"Are you sure you want to close the session with id [{session_id}]",
-                abort=False,
-            ):
-                try:
-                    session = sessions_client.close_session(session_id=session_id)
-                    closed_sessions.append(session)
-                except grpc.RpcError as e:
-                    if skip_not_found and e.code() == grpc.StatusCode.NOT_FOUND:
-                        logger.warning("Couldn't find session with id=%s, skipping...", session_id)
-                        continue
-                    else:
-                        raise e
-        return closed_sessions
+    # Ask for every confirmation first, then send the calls concurrently
+    confirmed_ids = confirm_sessions(session_ids, "close", confirm)
+    closed_sessions = []
+    for session_id, future in zip(
+        confirmed_ids, call_on_sessions(config, confirmed_ids, "close_session")
+    ):
+        try:
+            closed_sessions.append(future.result())
+        except grpc.RpcError as e:
+            if skip_not_found and e.code() == grpc.StatusCode.NOT_FOUND:
+                logger.warning("Couldn't find session with id=%s, skipping...", session_id)
+                continue
+            else:
+                raise e
+    return closed_sessions
 
 
 @sessions.command(name="purge", pass_config=True, auto_output="json")
@@ -328,25 +444,21 @@ def session_purge(
     **kwargs,
 ) -> Optional[List[Session]]:
     """Purge sessions."""
-    with akcc.create_grpc_channel(config) as channel:
-        sessions_client = ArmoniKSessions(channel)
-        purged_sessions = []
-        for session_id in session_ids:
-            if confirm or akcc.confirm(
-                f"Are you sure you want to purge the session with id [{session_id}]",
-                abort=False,
-            ):
-                try:
-                    session = sessions_client.purge_session(session_id=session_id)
-                    purged_sessions.append(session)
-                except grpc.RpcError as e:
-                    if skip_not_found and e.code() == grpc.StatusCode.NOT_FOUND:
-                        logger.warning("Couldn't find session with id=%s, skipping...", session_id)
-                        continue
-                    else:
-                        raise e
-
-        return purged_sessions
+    # Ask for every confirmation first, then send the calls concurrently
+    confirmed_ids = confirm_sessions(session_ids, "purge", confirm)
+    purged_sessions = []
+    for session_id, future in zip(
+        confirmed_ids, call_on_sessions(config, confirmed_ids, "purge_session")
+    ):
+        try:
+            purged_sessions.append(future.result())
+        except grpc.RpcError as e:
+            if skip_not_found and e.code() == grpc.StatusCode.NOT_FOUND:
+                logger.warning("Couldn't find session with id=%s, skipping...", session_id)
+                continue
+            else:
+                raise e
+    return purged_sessions
 
 
 @sessions.command(name="delete", pass_config=True, auto_output="json")
@@ -370,24 +482,21 @@ def session_delete(
     **kwargs,
 ) -> Optional[List[Session]]:
     """Delete sessions and their associated tasks from the cluster."""
-    with akcc.create_grpc_channel(config) as channel:
-        sessions_client = ArmoniKSessions(channel)
-        deleted_sessions = []
-        for session_id in session_ids:
-            if confirm or akcc.confirm(
-                f"Are you sure you want to delete the session with id [{session_id}]",
-                abort=False,
-            ):
-                try:
-                    session = sessions_client.delete_session(session_id=session_id)
-                    deleted_sessions.append(session)
-                except grpc.RpcError as e:
-                    if skip_not_found and e.code() == grpc.StatusCode.NOT_FOUND:
-                        logger.warning("Couldn't find session with id=%s, skipping...", session_id)
-                        continue
-                    else:
-                        raise e
-        return deleted_sessions
+    # Ask for every confirmation first, then send the calls concurrently
+    confirmed_ids = confirm_sessions(session_ids, "delete", confirm)
+    deleted_sessions = []
+    for session_id, future in zip(
+        confirmed_ids, call_on_sessions(config, confirmed_ids, "delete_session")
+    ):
+        try:
+            deleted_sessions.append(future.result())
+        except grpc.RpcError as e:
+            if skip_not_found and e.code() == grpc.StatusCode.NOT_FOUND:
+                logger.warning("Couldn't find session with id=%s, skipping...", session_id)
+                continue
+            else:
+                raise e
+    return deleted_sessions
 
 
 @sessions.command(name="stop-submission", pass_config=True, auto_output="json")
@@ -417,7 +526,7 @@ def session_delete(
 def session_stop_submission(
     config: akcc.CliConfig,
     logger: logging.Logger,
-    session_ids: str,
+    session_ids: List[str],
     confirm: bool,
     clients: bool,
     workers: bool,
@@ -425,28 +534,26 @@ def session_stop_submission(
     **kwargs,
 ) -> Optional[List[Session]]:
     """Stop clients and/or workers from submitting new tasks in a session."""
-    with akcc.create_grpc_channel(config) as channel:
-        sessions_client = ArmoniKSessions(channel)
-        submission_blocked_sessions = []
-        for session_id in session_ids:
-            blocked_submitters = (
-                ("clients" if clients else "")
-                + (" and " if clients and workers else "")
-                + ("workers" if workers else "")
-            )
-            if confirm or akcc.confirm(
-                f"Are you sure you want to stop {blocked_submitters} from submitting tasks to the session with id [{session_id}]",
-                abort=False,
-            ):
-                try:
-                    session = sessions_client.stop_submission_session(
-                        session_id=session_id, client=clients, worker=workers
-                    )
-                    submission_blocked_sessions.append(session)
-                except grpc.RpcError as e:
-                    if skip_not_found and e.code() == grpc.StatusCode.NOT_FOUND:
-                        logger.warning("Couldn't find session with id=%s, skipping...", session_id)
-                        continue
-                    else:
-                        raise e
-        return submission_blocked_sessions
+    blocked_submitters = " and ".join(
+        submitter for submitter, blocked in (("clients", clients), ("workers", workers)) if blocked
+    )
+    # Ask for every confirmation first, then send the calls concurrently
+    confirmed_ids = confirm_sessions(
+        session_ids, f"stop {blocked_submitters} from submitting tasks to", confirm
+    )
+    submission_blocked_sessions = []
+    for session_id, future in zip(
+        confirmed_ids,
+        call_on_sessions(
+            config, confirmed_ids, "stop_submission_session", client=clients, worker=workers
+        ),
+    ):
+        try:
+            submission_blocked_sessions.append(future.result())
+        except grpc.RpcError as e:
+            if skip_not_found and e.code() == grpc.StatusCode.NOT_FOUND:
+                logger.warning("Couldn't find session with id=%s, skipping...", session_id)
+                continue
+            else:
+                raise e
+    return submission_blocked_sessions
@@ -1,12 +1,22 @@
+import grpc
+import inspect
+import yaml
+
+from concurrent.futures import Future
 from datetime import timedelta
-from typing import List, Optional, Tuple, Union
+from functools import lru_cache, reduce
+from operator import or_
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 from armonik.client.tasks import ArmoniKTasks
-from armonik.common import Task, TaskDefinition, TaskOptions, Direction
+from armonik.common import Task, TaskDefinition, TaskOptions
 from armonik.common.filter import TaskFilter, Filter
 
 import armonik_cli_core as akcc
 
+from armonik_cli.commands.common import SORT_DIRECTIONS
+from armonik_cli.utils import iter_all_pages, lookup_by_ids, parse_time_delta
+
 
 @akcc.group(name="task")
 def tasks(**kwargs) -> None:
@@ -14,6 +24,50 @@ def tasks(**kwargs) -> None:
     pass
 
 
+@lru_cache(maxsize=8)
+def get_tasks_client(channel: grpc.Channel) -> ArmoniKTasks:
+    """
+    Get a tasks client for a shared channel, built once per channel.
+
+    Args:
+        channel: A shared gRPC channel, as returned by `akcc.get_grpc_channel(s)`.
+
+    Returns:
+        The tasks client using this channel.
+    """
+    return ArmoniKTasks(channel)
+
+
+def lookup_tasks(config: akcc.CliConfig, task_ids: List[str]) -> List["Future[Task]"]:
+    """
+    Get several tasks with as few calls as possible, spread over a pool of gRPC channels.
+
+    Args:
+        config: The CLI configuration.
+        task_ids: IDs of the tasks to get.
+
+    Returns:
+        The completed lookups, in the order of the given IDs, as returned by `lookup_by_ids`.
+    """
+    tasks_clients = [
+        get_tasks_client(channel) for channel in akcc.get_grpc_channels(config, len(task_ids))
+    ]
+
+    def list_batch(index: int, batch: List[str]) -> List[Task]:
+        _, batch_tasks = tasks_clients[index % len(tasks_clients)].list_tasks(
+            task_filter=reduce(or_, (Task.id == task_id for task_id in batch)),
+            with_errors=True,
+            page=0,
+            page_size=len(batch),
+        )
+        return batch_tasks
+
+    def get_task(index: int, task_id: str) -> Task:
+        return tasks_clients[index % len(tasks_clients)].get_task(task_id)
+
+    return lookup_by_ids(task_ids, list_batch, get_task, "id")
+
+
 @tasks.command(name="list", pass_config=True, auto_output="json")
 @akcc.option(
     "-f",
@@ -49,27 +103,29 @@ def task_list(
     page: int,
     page_size: int,
     **kwargs,
-) -> Optional[List[Task]]:
+) -> Optional[Iterable[Task]]:
     "List all tasks."
-    with akcc.create_grpc_channel(config) as channel:
-        tasks_client = ArmoniKTasks(channel)
-        curr_page = page if page > 0 else 0
-        tasks_list = []
-        while True:
-            total, curr_tasks_list = tasks_client.list_tasks(
-                task_filter=filter_with,
-                sort_field=Task.id if sort_by is None else sort_by,
-                sort_direction=Direction.ASC
-                if sort_direction.capitalize() == "ASC"
-                else Direction.DESC,
-                page=curr_page,
-                page_size=page_size,
-            )
-            tasks_list += curr_tasks_list
+    # Pages are fetched concurrently, spread over several connections
+    tasks_clients = [get_tasks_client(channel) for channel in akcc.get_grpc_channels(config)]
+
+    sort_field = Task.id if sort_by is None else sort_by
+    direction = SORT_DIRECTIONS[sort_direction.lower()]
 
-            if page > 0 or len(tasks_list) >= total:
-                break
-            curr_page += 1
+    def list_page(page_number: int) -> Tuple[int, List[Task]]:
+        return tasks_clients[page_number % len(tasks_clients)].list_tasks(
+            task_filter=filter_with,
+            sort_field=sort_field,
+            sort_direction=direction,
+            page=page_number,
+            page_size=page_size,
+        )
+
+    tasks_list: Iterable[Task]
+    if page > 0:
+        total, tasks_list = list_page(page)
+    else:
+        # Tasks are printed while the next pages are still being fetched
+        total, tasks_list = iter_all_pages(list_page, page_size)
 
     if total > 0:
         return tasks_list
@@ -80,22 +136,127 @@ def task_list(
 @akcc.argument("task-ids", type=str, nargs=-1, required=True)
 def task_get(config: akcc.CliConfig, task_ids: List[str], **kwargs):
     """Get a detailed overview of set of tasks given their ids."""
-    with akcc.create_grpc_channel(config) as channel:
-        tasks_client = ArmoniKTasks(channel)
-        tasks = []
-        for task_id in task_ids:
-            task = tasks_client.get_task(task_id)
-            tasks.append(task)
-        return tasks
+    return [future.result() for future in lookup_tasks(config, task_ids)]
 
 
 @tasks.command(name="cancel", pass_config=True, auto_output="json")
 @akcc.argument("task-ids", type=str, nargs=-1, required=True)
 def task_cancel(config: akcc.CliConfig, task_ids: List[str], **kwargs):
     "Cancel tasks given their ids. (They don't have to be in the same session necessarily)."
-    with akcc.create_grpc_channel(config) as channel:
-        tasks_client = ArmoniKTasks(channel)
-        tasks_client.cancel_tasks(task_ids)
+    tasks_client = get_tasks_client(akcc.get_grpc_channel(config))
+    tasks_client.cancel_tasks(task_ids)
+
+
+class TaskDefinitionsParam(akcc.ParamType):
+    """
+    A custom Click parameter type that reads a list of task definitions from a JSON or YAML file.
+
+    Each definition is a mapping of the options of 'task create' to their values. A single ID can
+    be given for the expected outputs and the data dependencies instead of a list of IDs.
+
+    Attributes:
+        name: The name of the parameter type, used by Click.
+    """
+
+    name = "task definitions"
+
+    def convert(
+        self, value: str, param: Union[akcc.Parameter, None], ctx: Union[akcc.Context, None]
+    ) -> List[Dict[str, Any]]:
+        """
+        Reads and validates the task definitions of a file.
+
+        Args:
+            value: The path of the file containing the task definitions.
+            param: The parameter object passed by Click.
+            ctx: The context in which the parameter is being used.
+
+        Returns:
+            The task definitions, as mappings of task options to their values.
+
+        Raises:
+            click.BadParameter: If the file isn't a list of valid task definitions.
+        """
+        file = akcc.File("r").convert(value, param, ctx)
+        try:
+            definitions = yaml.safe_load(file)
+        except yaml.YAMLError as error:
+            self.fail(f"Invalid task definitions: {error}", param, ctx)
+
+        if not isinstance(definitions, list) or not definitions:
+            self.fail("The file must contain a non-empty list of task definitions.", param, ctx)
+
+        known_fields = set(inspect.signature(build_task_definition).parameters)
+        task_definitions = []
+        for index, definition in enumerate(definitions):
+            if not isinstance(definition, dict):
+                self.fail(f"Task definition {index} isn't a mapping.", param, ctx)
+            unknown_fields = set(definition) - known_fields
+            if unknown_fields:
+                self.fail(
+                    f"Task definition {index} has unknown fields: {', '.join(sorted(unknown_fields))}.",
+                    param,
+                    ctx,
+                )
+            fields = {}
+            for field, field_value in definition.items():
+                try:
+                    fields[field] = self.convert_field(field, field_value)
+                except (TypeError, ValueError) as error:
+                    self.fail(
+                        f"Task definition {index} has an invalid {field}: {error}.", param, ctx
+                    )
+            if not fields.get("payload_id"):
+                self.fail(f"Task definition {index} needs a payload_id.", param, ctx)
+            if not fields.get("expected_outputs"):
+                self.fail(
+                    f"Task definition {index} needs at least one expected output.", param, ctx
+                )
+            task_definitions.append(fields)
+        return task_definitions
+
+    @staticmethod
+    def convert_field(field: str, value: Any) -> Any:
+        """
+        Converts the value of a field of a task definition to the type of the matching option.
+
+        Args:
+            field: The name of the field.
+            value: The value read from the file.
+
+        Returns:
+            The converted value.
+
+        Raises:
+            TypeError: If the value doesn't have the type of the field.
+            ValueError: If the value is a malformed duration.
+        """
+        if value is None:
+            return None
+        if field in ("expected_outputs", "data_dependencies"):
+            ids = [value] if isinstance(value, str) else value
+            if not isinstance(ids, list) or not all(isinstance(id_, str) for id_ in ids):
+                raise TypeError(f"expected an ID or a list of IDs, got {value!r}")
+            return ids
+        if field in ("max_retries", "priority"):
+            if isinstance(value, bool) or not isinstance(value, int):
+                raise TypeError(f"expected an integer, got {value!r}")
+            return value
+        if field == "max_duration":
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                # YAML reads durations such as 01:00:00 as a number of seconds
+                return timedelta(seconds=value)
+            try:
+                return parse_time_delta(value)
+            except (AttributeError, IndexError, TypeError, ValueError):
+                raise ValueError(f"{value!r} is not a valid time delta, use HH:MM:SS.MS") from None
+        if field == "options":
+            if not isinstance(value, dict):
+                raise TypeError(f"expected a mapping of option names to values, got {value!r}")
+            return [(str(key), str(option)) for key, option in value.items()]
+        if not isinstance(value, str):
+            raise TypeError(f"expected a string, got {value!r}")
+        return value
 
 
 @tasks.command(name="create", pass_config=True, auto_output="json")
@@ -110,6 +271,8 @@ def task_cancel(config: akcc.CliConfig, task_ids: List[str], **kwargs):
     "--payload-id",
     type=str,
     required=True,
+    cls=akcc.MutuallyExclusiveOption,
+    mutual=["from_file"],
     help="Id of the payload to associated to the task.",
     metavar="PAYLOAD_ID",
 )
@@ -117,15 +280,32 @@ def task_cancel(config: akcc.CliConfig, task_ids: List[str], **kwargs):
     "--expected-outputs",
     multiple=True,
     required=True,
+    cls=akcc.MutuallyExclusiveOption,
+    mutual=["from_file"],
     help="List of the ids of the task's outputs.",
     metavar="EXPECTED_OUTPUTS",
 )
 @akcc.option(
     "--data-dependencies",
     multiple=True,
+    cls=akcc.MutuallyExclusiveOption,
+    mutual=["from_file"],
     help="List of the ids of the task's data dependencies.",
     metavar="DATA_DEPENDENCIES",
 )
+@akcc.option(
+    "--from-file",
+    type=TaskDefinitionsParam(),
+    cls=akcc.MutuallyExclusiveOption,
+    mutual=["payload_id", "expected_outputs", "data_dependencies"],
+    help=(
+        "JSON or YAML file containing a list of task definitions to submit together. Each "
+        "definition is a mapping whose keys are the names of this command's task options "
+        "(payload_id, expected_outputs, data_dependencies, max_duration, priority, ...), the "
+        "options given on the command line being used as defaults."
+    ),
+    metavar="FILE",
+)
 @akcc.option(
     "--max-retries",
     type=int,
@@ -187,9 +367,10 @@ def task_cancel(config: akcc.CliConfig, task_ids: List[str], **kwargs):
 def task_create(
     config: akcc.CliConfig,
     session_id: str,
-    payload_id: str,
+    payload_id: Union[str, None],
     expected_outputs: List[str],
     data_dependencies: Union[List[str], None],
+    from_file: Union[List[Dict[str, Any]], None],
     max_retries: Union[int, None],
     max_duration: Union[timedelta, None],
     priority: Union[int, None],
@@ -201,37 +382,90 @@ def task_create(
     engine_type: Union[str, None],
     options: Union[List[Tuple[str, str]], None],
     **kwargs,
-) -> Optional[Task]:
-    """Create a task."""
-    with akcc.create_grpc_channel(config) as channel:
-        tasks_client = ArmoniKTasks(channel)
-        task_options = None
-        if max_duration is not None and priority is not None and max_retries is not None:
-            task_options = TaskOptions(
-                max_duration,
-                priority,
-                max_retries,
-                partition_id,
-                application_name,
-                application_version,
-                application_namespace,
-                application_service,
-                engine_type,
-                options,
-            )
-        elif any(arg is not None for arg in [max_duration, priority, max_retries]):
-            akcc.console.print(
-                akcc.style(
-                    "If you want to pass in additional task options please provide all three (max duration, priority, max retries)",
-                    "red",
-                )
-            )
-            raise akcc.MissingParameter(
-                "If you want to pass in additional task options please provide all three (max duration, priority, max retries)"
-            )
-        task_definition = TaskDefinition(
-            payload_id, expected_outputs, data_dependencies, task_options
+) -> Optional[Union[Task, List[Task]]]:
+    """Create a task, or several tasks at once from a file of task definitions."""
+    task_fields: Dict[str, Any] = {
+        "payload_id": payload_id,
+        "expected_outputs": expected_outputs,
+        "data_dependencies": data_dependencies,
+        "max_retries": max_retries,
+        "max_duration": max_duration,
+        "priority": priority,
+        "partition_id": partition_id,
+        "application_name": application_name,
+        "application_version": application_version,
+        "application_namespace": application_namespace,
+        "application_service": application_service,
+        "engine_type": engine_type,
+        "options": options,
+    }
+    if from_file is not None:
+        task_definitions = [
+            build_task_definition(**{**task_fields, **fields}) for fields in from_file
+        ]
+    else:
+        task_definitions = [build_task_definition(**task_fields)]
+
+    tasks_client = get_tasks_client(akcc.get_grpc_channel(config))
+    submitted_tasks = tasks_client.submit_tasks(session_id, task_definitions)
+
+    return submitted_tasks if from_file is not None else submitted_tasks[0]
+
+
+def build_task_definition(
+    payload_id: Union[str, None],
+    expected_outputs: List[str],
+    data_dependencies: Union[List[str], None],
+    max_retries: Union[int, None],
+    max_duration: Union[timedelta, None],
+    priority: Union[int, None],
+    partition_id: Union[str, None],
+    application_name: Union[str, None],
+    application_version: Union[str, None],
+    application_namespace: Union[str, None],
+    application_service: Union[str, None],
+    engine_type: Union[str, None],
+    options: Union[List[Tuple[str, str]], None],
+) -> TaskDefinition:
+    """
+    Build the definition of a task to submit.
+
+    Returns:
+        The task definition.
+
+    Raises:
+        akcc.MissingParameter: If the task's payload or outputs are missing, or if only some of
+            the max duration, priority and max retries are given.
+    """
+    if not payload_id or not expected_outputs:
+        raise akcc.MissingParameter(
+            "Each task needs a payload id and at least one expected output."
         )
-        submitted_tasks = tasks_client.submit_tasks(session_id, [task_definition])
 
-        return submitted_tasks[0]
+    task_options = None
+    if max_duration is not None and priority is not None and max_retries is not None:
+        task_options = TaskOptions(
+            max_duration,
+            priority,
+            max_retries,
+            partition_id,
+            application_name,
+            application_version,
+            application_namespace,
+            application_service,
+            engine_type,
+            dict(options or []),
+        )
+    elif any(arg is not None for arg in [max_duration, priority, max_retries]):
+        akcc.console.print(
+            akcc.style(
+                "If you want to pass in additional task options please provide all three (max duration, priority, max retries)",
+                "red",
+            )
+        )
+        raise akcc.MissingParameter(
+            "If you want to pass in additional task options please provide all three (max duration, priority, max retries)"
+        )
+    return TaskDefinition(
+        payload_id, list(expected_outputs), list(data_dependencies or []), task_options
+    )
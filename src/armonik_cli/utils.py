@@ -1,5 +1,39 @@
+import mmap
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import timedelta
-from typing import Union, get_origin, get_args
+from functools import lru_cache
+from itertools import islice
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    get_origin,
+    get_args,
+    TYPE_CHECKING,
+)
+
+if TYPE_CHECKING:
+    from rich.table import Table
+
+# Column header and the keyword arguments of its 'Table.add_column' call
+TableColumnSpec = Tuple[str, Dict[str, Any]]
+
+T = TypeVar("T")
+
+# Maximum number of IDs in the filter of a single listing call when looking up items by ID
+LOOKUP_BATCH_SIZE = 100
+# Maximum number of concurrent calls when looking up items by ID
+MAX_LOOKUP_WORKERS = 32
 
 
 def parse_time_delta(time_str: str) -> timedelta:
@@ -46,8 +80,146 @@ def remove_string_delimiters(s: str) -> str:
     return s
 
 
+def iter_all_pages(
+    list_page: Callable[[int], Tuple[int, List[T]]], page_size: int, max_workers: int = 8
+) -> Tuple[int, Iterator[T]]:
+    """Iterate over every page of a paginated listing.
+
+    The first page is fetched right away to get the total number of items, the other pages are
+    then fetched concurrently while the items of the previous ones are consumed. At most
+    `max_workers` pages are fetched ahead of the one being consumed, so that the memory used
+    doesn't grow with the total number of items when they are consumed slower than they arrive.
+
+    Args:
+        list_page: Function fetching a page given its number, returning the total number of
+            items and the items of the page.
+        page_size: Number of items in each page.
+        max_workers: Maximum number of pages fetched at the same time.
+
+    Returns:
+        The total number of items, and an iterator over the items of all the pages, in order.
+    """
+    total, first_page = list_page(0)
+    page_count = -(-total // page_size) if page_size > 0 else 1
+    if page_count <= 1:
+        return total, iter(first_page)
+
+    def items() -> Iterator[T]:
+        workers = min(max_workers, page_count - 1)
+        next_pages = iter(range(1, page_count))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = deque(
+                executor.submit(list_page, page) for page in islice(next_pages, workers)
+            )
+            try:
+                yield from first_page
+                while pending:
+                    _, page_items = pending.popleft().result()
+                    pending.extend(
+                        executor.submit(list_page, page) for page in islice(next_pages, 1)
+                    )
+                    yield from page_items
+            finally:
+                # Don't fetch the pages ahead if the iteration is stopped early
+                for future in pending:
+                    future.cancel()
+
+    return total, items()
+
+
+def fetch_all_pages(
+    list_page: Callable[[int], Tuple[int, List[T]]], page_size: int, max_workers: int = 8
+) -> List[T]:
+    """Fetch every page of a paginated listing.
+
+    Args:
+        list_page: Function fetching a page given its number, returning the total number of
+            items and the items of the page.
+        page_size: Number of items in each page.
+        max_workers: Maximum number of pages fetched at the same time.
+
+    Returns:
+        The items of all the pages, in order.
+    """
+    return list(iter_all_pages(list_page, page_size, max_workers)[1])
+
+
+def lookup_by_ids(
+    ids: List[str],
+    list_batch: Callable[[int, List[str]], List[T]],
+    get_item: Callable[[int, str], T],
+    id_field: str,
+    batch_size: int = LOOKUP_BATCH_SIZE,
+    max_workers: int = MAX_LOOKUP_WORKERS,
+) -> List["Future[T]"]:
+    """Get several items given their IDs with as few calls as possible.
+
+    The items are listed in batches of `batch_size` IDs, concurrently. The IDs that the listing
+    didn't return are then looked up one by one, so that their lookup fails with the error
+    explaining why they couldn't be found.
+
+    Args:
+        ids: IDs of the items to get.
+        list_batch: Function listing the items of a batch of IDs, given the index of the batch
+            and its IDs.
+        get_item: Function getting a single item, given the index of the call and the item's ID.
+        id_field: Name of the attribute holding the ID of an item.
+        batch_size: Maximum number of IDs in each batch.
+        max_workers: Maximum number of calls made at the same time.
+
+    Returns:
+        The completed lookups, in the order of the given IDs. A failed lookup raises its error
+        when its result is retrieved.
+    """
+    unique_ids = list(dict.fromkeys(ids))
+    if not unique_ids:
+        return []
+    batches = [
+        unique_ids[start : start + batch_size] for start in range(0, len(unique_ids), batch_size)
+    ]
+
+    lookups: Dict[str, "Future[T]"] = {}
+    # Threads are only started when needed, the listing uses one per batch at most
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_ids))) as executor:
+        for batch_items in executor.map(list_batch, range(len(batches)), batches):
+            for item in batch_items:
+                lookups[getattr(item, id_field)] = Future()
+                lookups[getattr(item, id_field)].set_result(item)
+        missing_ids = [item_id for item_id in unique_ids if item_id not in lookups]
+        for index, item_id in enumerate(missing_ids):
+            lookups[item_id] = executor.submit(get_item, index, item_id)
+    return [lookups[item_id] for item_id in ids]
+
+
+@contextmanager
+def map_file(file: IO[bytes]) -> Iterator[Union[bytes, mmap.mmap]]:
+    """Map a binary file in memory to read its content lazily.
+
+    The mapping can be sliced like bytes, but its pages are only read when they are accessed, so
+    a large file can be sent in chunks without being loaded at once. Files that can't be mapped
+    (empty files, pipes...) are read instead.
+
+    Args:
+        file: A file opened in binary read mode.
+
+    Yields:
+        The content of the file, as a read-only memory map or as bytes.
+    """
+    try:
+        data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        yield file.read()
+        return
+    with data:
+        yield data
+
+
+@lru_cache(maxsize=256)
 def pretty_type(tp):
-    """Recursively formats type hints for better readability."""
+    """Recursively formats type hints for better readability.
+
+    Results are memoized on the (hashable) type hint, so this function must remain pure.
+    """
     origin = get_origin(tp)
     args = get_args(tp)
 
@@ -64,3 +236,22 @@ def pretty_type(tp):
 
     formatted_args = ", ".join(pretty_type(arg) for arg in args)
     return f"{origin.__name__}[{formatted_args}]"
+
+
+def build_table(columns: Sequence[TableColumnSpec], grid: bool = False, **kwargs: Any) -> "Table":
+    """Build an empty Rich table with the given columns.
+
+    Args:
+        columns: The header and `add_column` keyword arguments of each column.
+        grid: Whether to build a grid (a table without borders or headers).
+        **kwargs: Keyword arguments passed to the table constructor.
+
+    Returns:
+        A new table with its columns configured, ready for rows to be added.
+    """
+    from rich.table import Table
+
+    table = Table.grid(**kwargs) if grid else Table(**kwargs)
+    for header, column_kwargs in columns:
+        table.add_column(header, **column_kwargs)
+    return table
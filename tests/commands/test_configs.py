@@ -0,0 +1,18 @@
+import yaml
+
+from armonik_cli_core import CliConfig
+from armonik_cli_core.configuration import invalidate_cli_config
+from conftest import run_cmd_and_assert_exit_code, reformat_cmd_output
+
+
+def test_config_show_saved_config(tmp_path, monkeypatch):
+    config_path = tmp_path / "config.yml"
+    config_path.write_text(yaml.dump({"endpoint": "saved-endpoint:5001", "output": "json"}))
+    monkeypatch.setattr(CliConfig, "default_path", config_path)
+    invalidate_cli_config()
+
+    try:
+        result = run_cmd_and_assert_exit_code("config show --endpoint other-endpoint:5001")
+    finally:
+        invalidate_cli_config()
+    assert reformat_cmd_output(result.output, deserialize=True)["endpoint"] == "saved-endpoint:5001"
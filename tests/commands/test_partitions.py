@@ -2,7 +2,7 @@ from copy import deepcopy
 import pytest
 
 from armonik.client import ArmoniKPartitions
-from armonik.common import Partition
+from armonik.common import Direction, Partition
 
 from conftest import run_cmd_and_assert_exit_code, reformat_cmd_output
 
@@ -63,6 +63,15 @@ def test_partition_list(mocker, cmd):
     assert reformat_cmd_output(result.output, deserialize=True) == serialized_partitions
 
 
+@pytest.mark.parametrize(
+    ("option", "direction"), [("asc", Direction.ASC), ("DESC", Direction.DESC)]
+)
+def test_partition_list_sort_direction(mocker, option, direction):
+    mocker.patch.object(ArmoniKPartitions, "list_partitions", return_value=(0, []))
+    run_cmd_and_assert_exit_code(f"partition list -e {ENDPOINT} --sort-direction {option}")
+    assert ArmoniKPartitions.list_partitions.call_args.kwargs["sort_direction"] == direction
+
+
 @pytest.mark.parametrize(
     "cmd, expected_output",
     [
@@ -1,12 +1,15 @@
 from copy import deepcopy
 from datetime import datetime
+import grpc
 import pathlib
-from unittest.mock import Mock, mock_open
+from unittest.mock import Mock, call, mock_open
 import pytest
 
 from armonik.client.results import ArmoniKResults
-from armonik.common import Result, ResultStatus
+from armonik.common import Direction, Result, ResultStatus
 
+from armonik_cli.commands.results import lookup_results
+from armonik_cli_core import CliConfig
 from conftest import run_cmd_and_assert_exit_code, reformat_cmd_output
 
 ENDPOINT = "172.17.119.85:5001"
@@ -73,6 +76,26 @@ def test_result_list(mocker, cmd):
     assert reformat_cmd_output(result.output, deserialize=True) == serialized_results
 
 
+def test_result_list_all_pages(mocker):
+    mocker.patch.object(
+        ArmoniKResults,
+        "list_results",
+        side_effect=[(2, [deepcopy(raw_results[0])]), (2, [deepcopy(raw_results[1])])],
+    )
+    result = run_cmd_and_assert_exit_code(f"result list -e {ENDPOINT} --output json --page-size 1")
+    assert reformat_cmd_output(result.output, deserialize=True) == serialized_results
+    assert ArmoniKResults.list_results.call_count == 2
+
+
+@pytest.mark.parametrize(
+    ("option", "direction"), [("asc", Direction.ASC), ("DESC", Direction.DESC)]
+)
+def test_result_list_sort_direction(mocker, option, direction):
+    mocker.patch.object(ArmoniKResults, "list_results", return_value=(0, []))
+    run_cmd_and_assert_exit_code(f"result list -e {ENDPOINT} --sort-direction {option}")
+    assert ArmoniKResults.list_results.call_args.kwargs["sort_direction"] == direction
+
+
 @pytest.mark.parametrize(
     "cmd, expected_output",
     [
@@ -93,9 +116,29 @@ def test_result_get(mocker, cmd, expected_output):
         elif result_id == serialized_results[1]["ResultId"]:
             return deepcopy(raw_results[1])
 
+    mocker.patch.object(ArmoniKResults, "list_results", return_value=(2, deepcopy(raw_results)))
     mocker.patch.object(ArmoniKResults, "get_result", side_effect=get_result_side_effect)
     result = run_cmd_and_assert_exit_code(cmd)
     assert reformat_cmd_output(result.output, deserialize=True) == expected_output
+    ArmoniKResults.list_results.assert_called_once()
+    ArmoniKResults.get_result.assert_not_called()
+
+
+def test_lookup_results_batches(mocker):
+    result_ids = [f"result-{index}" for index in range(250)]
+    mocker.patch.object(ArmoniKResults, "list_results", return_value=(0, []))
+    mocker.patch.object(
+        ArmoniKResults, "get_result", side_effect=lambda result_id: f"got {result_id}"
+    )
+
+    lookups = lookup_results(CliConfig.from_dict({"endpoint": ENDPOINT}), result_ids)
+
+    assert [lookup.result() for lookup in lookups] == [
+        f"got {result_id}" for result_id in result_ids
+    ]
+    assert sorted(
+        call.kwargs["page_size"] for call in ArmoniKResults.list_results.call_args_list
+    ) == [50, 100, 100]
 
 
 @pytest.mark.parametrize(
@@ -133,6 +176,7 @@ def test_result_delete_data(mocker, cmd, expected_output):
     mocker.patch("grpc.insecure_channel", return_value=mock_channel)
 
     # Patch the methods on ArmoniKResults class itself
+    mocker.patch.object(ArmoniKResults, "list_results", return_value=(2, deepcopy(raw_results)))
     mocker.patch.object(ArmoniKResults, "get_result", side_effect=get_result_side_effect)
     mocker.patch.object(ArmoniKResults, "delete_result_data")
 
@@ -146,6 +190,74 @@ def test_result_delete_data(mocker, cmd, expected_output):
     )
 
 
+def test_result_delete_data_several_sessions(mocker):
+    other_session_result = deepcopy(raw_results[1])
+    other_session_result.session_id = "other-session-id"
+    mocker.patch.object(
+        ArmoniKResults,
+        "list_results",
+        return_value=(2, [other_session_result, deepcopy(raw_results[0])]),
+    )
+    mocker.patch.object(ArmoniKResults, "delete_result_data")
+
+    run_cmd_and_assert_exit_code(
+        f"result delete-data --endpoint {ENDPOINT} {raw_results[1].result_id} "
+        f"{raw_results[0].result_id} --confirm"
+    )
+
+    assert sorted(ArmoniKResults.delete_result_data.call_args_list) == sorted(
+        [
+            call([raw_results[0].result_id], raw_results[0].session_id),
+            call([raw_results[1].result_id], "other-session-id"),
+        ]
+    )
+
+
+def test_result_delete_data_with_session_id(mocker):
+    mocker.patch.object(ArmoniKResults, "list_results")
+    mocker.patch.object(ArmoniKResults, "get_result")
+    mocker.patch.object(ArmoniKResults, "delete_result_data")
+
+    run_cmd_and_assert_exit_code(
+        f"result delete-data --endpoint {ENDPOINT} result-1 result-2 --session-id session-id "
+        "--confirm"
+    )
+
+    ArmoniKResults.list_results.assert_not_called()
+    ArmoniKResults.get_result.assert_not_called()
+    ArmoniKResults.delete_result_data.assert_called_once_with(
+        ["result-1", "result-2"], "session-id"
+    )
+
+
+def test_result_delete_data_skip_not_found(mocker):
+    class NotFoundError(grpc.RpcError):
+        def code(self):
+            return grpc.StatusCode.NOT_FOUND
+
+    def get_result_side_effect(result_id):
+        if result_id == serialized_results[1]["ResultId"]:
+            return deepcopy(raw_results[1])
+        raise NotFoundError()
+
+    mocker.patch.object(
+        ArmoniKResults, "list_results", return_value=(1, [deepcopy(raw_results[1])])
+    )
+    mocker.patch.object(ArmoniKResults, "get_result", side_effect=get_result_side_effect)
+    mocker.patch.object(ArmoniKResults, "delete_result_data")
+
+    run_cmd_and_assert_exit_code(
+        f"result delete-data --endpoint {ENDPOINT} unknown-id {serialized_results[1]['ResultId']} "
+        "--confirm --skip-not-found"
+    )
+
+    # Only the result missing from the listing is looked up on its own
+    ArmoniKResults.get_result.assert_called_once_with("unknown-id")
+    ArmoniKResults.delete_result_data.assert_called_once_with(
+        [serialized_results[1]["ResultId"]], serialized_results[1]["SessionId"]
+    )
+
+
 def test_result_create_file_not_found(mocker):
     # Create a mock channel that supports context manager
     mock_channel = Mock()
@@ -273,6 +385,127 @@ def test_result_create_mixed(mocker):
     )
 
 
+def test_result_create_with_file(mocker, tmp_path):
+    file_path = tmp_path / "data.bin"
+    file_path.write_bytes(b"file content")
+    mocker.patch.object(ArmoniKResults, "create_results_metadata", return_value={})
+    mocker.patch.object(ArmoniKResults, "create_results", return_value={})
+    mocker.patch.object(ArmoniKResults, "upload_result_data")
+
+    cmd = [
+        "result",
+        "create",
+        "my-session-id",
+        "--result",
+        f"result1 file {file_path}",
+        "--endpoint",
+        ENDPOINT,
+    ]
+    run_cmd_and_assert_exit_code(cmd, split=False)
+
+    ArmoniKResults.create_results_metadata.assert_not_called()
+    ArmoniKResults.create_results.assert_called_once_with(
+        session_id="my-session-id", results_data={"result1": b"file content"}
+    )
+    ArmoniKResults.upload_result_data.assert_not_called()
+
+
+def test_result_create_with_large_file(mocker, tmp_path):
+    mocker.patch("armonik_cli.commands.results.MAX_INLINE_FILE_SIZE", 4)
+    file_path = tmp_path / "data.bin"
+    file_path.write_bytes(b"file content")
+    created_result = deepcopy(raw_results[0])
+    created_result.name = "result1"
+
+    uploaded_data = []
+    mocker.patch.object(
+        ArmoniKResults, "create_results_metadata", return_value={"result1": created_result}
+    )
+    mocker.patch.object(ArmoniKResults, "create_results", return_value={})
+    mocker.patch.object(
+        ArmoniKResults,
+        "upload_result_data",
+        side_effect=lambda result_id, session_id, data: uploaded_data.append(
+            (result_id, session_id, bytes(data[:]))
+        ),
+    )
+    mocker.patch.object(ArmoniKResults, "list_results", return_value=(1, [created_result]))
+
+    cmd = [
+        "result",
+        "create",
+        "my-session-id",
+        "--result",
+        f"result1 file {file_path}",
+        "--endpoint",
+        ENDPOINT,
+    ]
+    run_cmd_and_assert_exit_code(cmd, split=False)
+
+    ArmoniKResults.create_results_metadata.assert_called_once_with(
+        session_id="my-session-id", result_names=["result1"]
+    )
+    ArmoniKResults.create_results.assert_not_called()
+    assert uploaded_data == [(created_result.result_id, "my-session-id", b"file content")]
+
+
+def test_result_create_with_several_files(mocker, tmp_path):
+    mocker.patch("armonik_cli.commands.results.MAX_INLINE_FILE_SIZE", 0)
+    created_results = {}
+    for index, raw_result in enumerate(raw_results):
+        (tmp_path / f"data{index}.bin").write_bytes(f"content {index}".encode())
+        created_results[f"result{index}"] = deepcopy(raw_result)
+
+    uploaded_data = []
+    mocker.patch.object(ArmoniKResults, "create_results_metadata", return_value=created_results)
+    mocker.patch.object(
+        ArmoniKResults,
+        "upload_result_data",
+        side_effect=lambda result_id, session_id, data: uploaded_data.append(
+            (result_id, bytes(data[:]))
+        ),
+    )
+    mocker.patch.object(
+        ArmoniKResults, "list_results", return_value=(2, list(created_results.values()))
+    )
+
+    cmd = ["result", "create", "my-session-id", "--endpoint", ENDPOINT]
+    for index in range(len(raw_results)):
+        cmd += ["--result", f"result{index} file {tmp_path / f'data{index}.bin'}"]
+    run_cmd_and_assert_exit_code(cmd, split=False)
+
+    assert sorted(uploaded_data) == sorted(
+        (raw_result.result_id, f"content {index}".encode())
+        for index, raw_result in enumerate(raw_results)
+    )
+
+
+def test_result_create_with_failed_upload(mocker, tmp_path):
+    mocker.patch("armonik_cli.commands.results.MAX_INLINE_FILE_SIZE", 0)
+    created_results = {}
+    for index, raw_result in enumerate(raw_results):
+        (tmp_path / f"data{index}.bin").write_bytes(f"content {index}".encode())
+        created_results[f"result{index}"] = deepcopy(raw_result)
+    failed_id = raw_results[0].result_id
+
+    def upload_result_data(result_id, session_id, data):
+        if result_id == failed_id:
+            raise RuntimeError("upload failed")
+
+    mocker.patch.object(ArmoniKResults, "create_results_metadata", return_value=created_results)
+    mocker.patch.object(ArmoniKResults, "upload_result_data", side_effect=upload_result_data)
+
+    cmd = ["result", "create", "my-session-id", "--endpoint", ENDPOINT]
+    for index in range(len(raw_results)):
+        cmd += ["--result", f"result{index} file {tmp_path / f'data{index}.bin'}"]
+    result = run_cmd_and_assert_exit_code(cmd, exit_code=3, split=False)
+
+    # Every upload is attempted and the results left without data are reported
+    assert ArmoniKResults.upload_result_data.call_count == len(raw_results)
+    assert failed_id in reformat_cmd_output(result.output)
+    assert "upload failed" in result.output
+
+
 def test_result_upload_data_from_bytes(mocker):
     # Create a mock channel that supports context manager
     mock_channel = Mock()
@@ -302,7 +535,7 @@ def test_result_upload_data_from_bytes(mocker):
     )
 
 
-def test_result_upload_data_from_file(mocker):
+def test_result_upload_data_from_file(mocker, tmp_path):
     # Create a mock channel that supports context manager
     mock_channel = Mock()
     mock_channel.__enter__ = Mock(return_value=mock_channel)
@@ -311,12 +544,19 @@ def test_result_upload_data_from_file(mocker):
     # Patch the channel creation
     mocker.patch("grpc.insecure_channel", return_value=mock_channel)
 
-    # Patch the methods on ArmoniKResults class
-    mocker.patch.object(ArmoniKResults, "upload_result_data", return_value=None)
+    # Patch the methods on ArmoniKResults class, the data is only readable during the call
+    uploaded_data = []
+    mocker.patch.object(
+        ArmoniKResults,
+        "upload_result_data",
+        side_effect=lambda result_id, session_id, data: uploaded_data.append(
+            (result_id, session_id, bytes(data[:]))
+        ),
+    )
 
-    # Mock file operations
-    mock_file_content = b"file content"
-    mocker.patch("builtins.open", mock_open(read_data=mock_file_content))
+    file_content = b"file content"
+    file_path = tmp_path / "test.txt"
+    file_path.write_bytes(file_content)
 
     cmd = [
         "result",
@@ -324,14 +564,64 @@ def test_result_upload_data_from_file(mocker):
         "my-session-id",
         "result-id",
         "--from-file",
-        "test.txt",
+        str(file_path),
         "--endpoint",
         ENDPOINT,
     ]
     run_cmd_and_assert_exit_code(cmd, split=False)
 
+    assert uploaded_data == [("result-id", "my-session-id", file_content)]
+
+
+@pytest.mark.parametrize(
+    ("option", "value"), [("--from-hex", "68656c6c6f"), ("--from-base64", "aGVsbG8=")]
+)
+def test_result_upload_data_from_encoded_string(mocker, option, value):
+    mocker.patch.object(ArmoniKResults, "upload_result_data", return_value=None)
+
+    cmd = ["result", "upload-data", "my-session-id", "result-id", option, value]
+    cmd += ["--endpoint", ENDPOINT]
+    run_cmd_and_assert_exit_code(cmd, split=False)
+
     ArmoniKResults.upload_result_data.assert_called_once_with(
-        "result-id", "my-session-id", mock_file_content
+        "result-id", "my-session-id", b"hello"
+    )
+
+
+@pytest.mark.parametrize(
+    ("option", "value"),
+    [("--from-hex", "68656c6c6fzz"), ("--from-base64", "aGVs*bG8="), ("--from-base64", "aGVsbG8")],
+)
+def test_result_upload_data_from_invalid_encoded_string(mocker, option, value):
+    mocker.patch.object(ArmoniKResults, "upload_result_data", return_value=None)
+
+    cmd = ["result", "upload-data", "my-session-id", "result-id", option, value]
+    cmd += ["--endpoint", ENDPOINT]
+    result = run_cmd_and_assert_exit_code(cmd, exit_code=2, split=False)
+
+    assert f"Invalid value for '{option}'" in result.output
+    ArmoniKResults.upload_result_data.assert_not_called()
+
+
+def test_result_upload_data_from_opaque_id(mocker):
+    mocker.patch.object(ArmoniKResults, "upload_result_data", return_value=None)
+    mocker.patch.object(ArmoniKResults, "import_data", return_value={})
+
+    cmd = [
+        "result",
+        "upload-data",
+        "my-session-id",
+        "result-id",
+        "--from-opaque-id",
+        "object-key",
+        "--endpoint",
+        ENDPOINT,
+    ]
+    run_cmd_and_assert_exit_code(cmd, split=False)
+
+    ArmoniKResults.upload_result_data.assert_not_called()
+    ArmoniKResults.import_data.assert_called_once_with(
+        "my-session-id", [("result-id", b"object-key")]
     )
 
 
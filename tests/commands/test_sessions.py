@@ -1,10 +1,16 @@
+import grpc
+import json
 import pytest
+import threading
 
 from datetime import datetime, timedelta
 from copy import deepcopy
 
 from armonik.client import ArmoniKSessions
-from armonik.common import Session, TaskOptions, SessionStatus
+from armonik.common import Direction, Session, TaskOptions, SessionStatus
+
+from armonik_cli.commands.sessions import call_on_sessions, lookup_sessions
+from armonik_cli_core import CliConfig
 from conftest import run_cmd_and_assert_exit_code, reformat_cmd_output
 
 ENDPOINT = "172.17.119.85:5001"
@@ -78,6 +84,27 @@ def test_session_list(mocker, cmd):
     assert reformat_cmd_output(result.output, deserialize=True) == [serialized_session]
 
 
+@pytest.mark.parametrize(
+    ("option", "direction"), [("asc", Direction.ASC), ("DESC", Direction.DESC)]
+)
+def test_session_list_sort_direction(mocker, option, direction):
+    mocker.patch.object(ArmoniKSessions, "list_sessions", return_value=(0, []))
+    run_cmd_and_assert_exit_code(f"session list -e {ENDPOINT} --sort-direction {option}")
+    assert ArmoniKSessions.list_sessions.call_args.kwargs["sort_direction"] == direction
+
+
+def test_session_list_all_pages(mocker):
+    def list_sessions_side_effect(page, **kwargs):
+        return 3, [Session(session_id=f"id-{page}")]
+
+    mocker.patch.object(ArmoniKSessions, "list_sessions", side_effect=list_sessions_side_effect)
+    result = run_cmd_and_assert_exit_code(f"session list -e {ENDPOINT} --output json --page-size 1")
+    assert [
+        session["SessionId"] for session in reformat_cmd_output(result.output, deserialize=True)
+    ] == ["id-0", "id-1", "id-2"]
+    assert ArmoniKSessions.list_sessions.call_count == 3
+
+
 @pytest.mark.parametrize(
     "cmd",
     [
@@ -85,9 +112,30 @@ def test_session_list(mocker, cmd):
     ],
 )
 def test_session_get(mocker, cmd):
+    mocker.patch.object(ArmoniKSessions, "list_sessions", return_value=(1, [deepcopy(raw_session)]))
     mocker.patch.object(ArmoniKSessions, "get_session", return_value=deepcopy(raw_session))
     result = run_cmd_and_assert_exit_code(cmd)
     assert reformat_cmd_output(result.output, deserialize=True) == [serialized_session]
+    ArmoniKSessions.get_session.assert_not_called()
+
+
+def test_lookup_sessions_missing(mocker):
+    class NotFoundError(grpc.RpcError):
+        def code(self):
+            return grpc.StatusCode.NOT_FOUND
+
+    mocker.patch.object(
+        ArmoniKSessions, "list_sessions", return_value=(1, [Session(session_id="id-1")])
+    )
+    mocker.patch.object(ArmoniKSessions, "get_session", side_effect=NotFoundError())
+
+    lookups = lookup_sessions(CliConfig.from_dict({"endpoint": ENDPOINT}), ["unknown-id", "id-1"])
+
+    # Only the session missing from the listing is looked up on its own
+    ArmoniKSessions.get_session.assert_called_once_with(session_id="unknown-id")
+    with pytest.raises(NotFoundError):
+        lookups[0].result()
+    assert lookups[1].result().session_id == "id-1"
 
 
 @pytest.mark.parametrize(
@@ -121,6 +169,44 @@ def test_session_cancel(mocker, cmd, prompt):
     ) == [serialized_session]
 
 
+def test_session_cancel_several_sessions(mocker):
+    class NotFoundError(grpc.RpcError):
+        def code(self):
+            return grpc.StatusCode.NOT_FOUND
+
+    def cancel_session_side_effect(session_id):
+        if session_id == "unknown-id":
+            raise NotFoundError()
+        return Session(session_id=session_id)
+
+    mocker.patch.object(ArmoniKSessions, "cancel_session", side_effect=cancel_session_side_effect)
+    result = run_cmd_and_assert_exit_code(
+        f"session cancel --endpoint {ENDPOINT} --skip-not-found id-1 unknown-id id-2 id-3",
+        input="n\ny\ny\nn\ny\n",
+    )
+
+    # Refused sessions aren't cancelled, the others are returned in order
+    assert ArmoniKSessions.cancel_session.call_count == 3
+    assert [
+        session["SessionId"] for session in json.loads(result.output[result.output.index("\n[") :])
+    ] == ["id-1", "id-3"]
+
+
+def test_session_cancel_confirm_all(mocker):
+    mocker.patch.object(
+        ArmoniKSessions,
+        "cancel_session",
+        side_effect=lambda session_id: Session(session_id=session_id),
+    )
+    result = run_cmd_and_assert_exit_code(
+        f"session cancel --endpoint {ENDPOINT} id-1 id-2 id-3", input="y\n"
+    )
+
+    # A single prompt confirms the cancellation of every session
+    assert result.output.count("Are you sure") == 1
+    assert ArmoniKSessions.cancel_session.call_count == 3
+
+
 @pytest.mark.parametrize(
     "cmd",
     [
@@ -204,3 +290,25 @@ def test_session_stop_submission(mocker, cmd):
     )
     result = run_cmd_and_assert_exit_code(cmd)
     assert reformat_cmd_output(result.output, deserialize=True) == [serialized_session]
+
+
+def test_call_on_sessions_interrupted(mocker):
+    release = threading.Event()
+
+    def interrupted_wait(futures):
+        release.set()
+        raise KeyboardInterrupt
+
+    mocker.patch("armonik_cli.commands.sessions.MAX_SESSION_WORKERS", 1)
+    mocker.patch("armonik_cli.commands.sessions.wait", side_effect=interrupted_wait)
+    mocker.patch.object(
+        ArmoniKSessions, "pause_session", side_effect=lambda session_id: release.wait(timeout=5)
+    )
+
+    with pytest.raises(KeyboardInterrupt):
+        call_on_sessions(
+            CliConfig.from_dict({"endpoint": ENDPOINT}), ["id-1", "id-2", "id-3"], "pause_session"
+        )
+
+    # The calls still waiting for a worker are dropped
+    assert ArmoniKSessions.pause_session.call_count <= 1
@@ -3,8 +3,10 @@ from datetime import datetime, timedelta
 import pytest
 
 from armonik.client import ArmoniKTasks
-from armonik.common import Task, TaskOptions, TaskStatus
+from armonik.common import Direction, Output, Task, TaskOptions, TaskStatus
 
+from armonik_cli.commands.tasks import lookup_tasks
+from armonik_cli_core import CliConfig
 from conftest import run_cmd_and_assert_exit_code, reformat_cmd_output
 
 
@@ -214,6 +216,26 @@ def test_task_list(mocker, cmd):
     assert reformat_cmd_output(result.output, deserialize=True) == serialized_tasks
 
 
+def test_task_list_all_pages(mocker):
+    mocker.patch.object(
+        ArmoniKTasks,
+        "list_tasks",
+        side_effect=lambda page, **kwargs: (2, [deepcopy(raw_tasks[page])]),
+    )
+    result = run_cmd_and_assert_exit_code(f"task list -e {ENDPOINT} --output json --page-size 1")
+    assert reformat_cmd_output(result.output, deserialize=True) == serialized_tasks
+    assert ArmoniKTasks.list_tasks.call_count == 2
+
+
+@pytest.mark.parametrize(
+    ("option", "direction"), [("asc", Direction.ASC), ("DESC", Direction.DESC)]
+)
+def test_task_list_sort_direction(mocker, option, direction):
+    mocker.patch.object(ArmoniKTasks, "list_tasks", return_value=(0, []))
+    run_cmd_and_assert_exit_code(f"task list -e {ENDPOINT} --sort-direction {option}")
+    assert ArmoniKTasks.list_tasks.call_args.kwargs["sort_direction"] == direction
+
+
 @pytest.mark.parametrize(
     "cmd, expected_outputs",
     [
@@ -228,15 +250,45 @@ def test_task_list(mocker, cmd):
     ],
 )
 def test_task_get(mocker, cmd, expected_outputs):
-    def get_task_side_effect(task_id):
-        if task_id == serialized_tasks[0]["Id"]:
-            return deepcopy(raw_tasks[0])
-        elif task_id == serialized_tasks[1]["Id"]:
-            return deepcopy(raw_tasks[1])
-
-    mocker.patch.object(ArmoniKTasks, "get_task", side_effect=get_task_side_effect)
+    # The listing doesn't keep the order of the requested IDs
+    mocker.patch.object(
+        ArmoniKTasks,
+        "list_tasks",
+        return_value=(len(expected_outputs), deepcopy(raw_tasks[: len(expected_outputs)])[::-1]),
+    )
+    mocker.patch.object(ArmoniKTasks, "get_task")
     result = run_cmd_and_assert_exit_code(cmd)
     assert reformat_cmd_output(result.output, deserialize=True) == expected_outputs
+    ArmoniKTasks.list_tasks.assert_called_once()
+    ArmoniKTasks.get_task.assert_not_called()
+
+
+def test_task_get_not_listed(mocker):
+    mocker.patch.object(ArmoniKTasks, "list_tasks", return_value=(1, [deepcopy(raw_tasks[1])]))
+    mocker.patch.object(ArmoniKTasks, "get_task", return_value=deepcopy(raw_tasks[0]))
+    result = run_cmd_and_assert_exit_code(
+        f"task get --endpoint {ENDPOINT} --output json "
+        f"{serialized_tasks[0]['Id']} {serialized_tasks[1]['Id']}"
+    )
+    assert reformat_cmd_output(result.output, deserialize=True) == serialized_tasks
+    ArmoniKTasks.get_task.assert_called_once_with(serialized_tasks[0]["Id"])
+
+
+def test_task_get_with_output_error(mocker):
+    failed_task = deepcopy(raw_tasks[0])
+    failed_task.status = TaskStatus.ERROR
+
+    def list_tasks(*args, with_errors=False, **kwargs):
+        failed_task.output = Output(error="Worker crashed") if with_errors else None
+        return 1, [failed_task]
+
+    mocker.patch.object(ArmoniKTasks, "list_tasks", side_effect=list_tasks)
+    result = run_cmd_and_assert_exit_code(
+        f"task get --endpoint {ENDPOINT} --output json {serialized_tasks[0]['Id']}"
+    )
+    assert reformat_cmd_output(result.output, deserialize=True)[0]["Output"] == {
+        "Error": "Worker crashed"
+    }
 
 
 @pytest.mark.parametrize(
@@ -271,3 +323,137 @@ def test_task_cancel(mocker, cmd):
 def test_task_create(mocker, cmd, exit_code):
     mocker.patch.object(ArmoniKTasks, "submit_tasks", return_value=[deepcopy(raw_tasks[0])])
     run_cmd_and_assert_exit_code(cmd, exit_code=exit_code)
+
+
+def test_task_create_from_file(mocker, tmp_path):
+    definitions = tmp_path / "tasks.yaml"
+    definitions.write_text(
+        "- payload_id: payload-0\n"
+        "  expected_outputs: [output-0]\n"
+        "- payload_id: payload-1\n"
+        "  expected_outputs: [output-1]\n"
+        "  data_dependencies: [output-0]\n"
+        "  max_duration: 00:01:00\n"
+        "  options: {key: value}\n"
+    )
+    mocker.patch.object(
+        ArmoniKTasks, "submit_tasks", return_value=[deepcopy(raw_tasks[0]), deepcopy(raw_tasks[1])]
+    )
+    run_cmd_and_assert_exit_code(
+        f"task create --endpoint {ENDPOINT} --session-id sessionid --from-file {definitions} "
+        "--max-duration 00:00:15 --priority 1 --max-retries 2"
+    )
+
+    ArmoniKTasks.submit_tasks.assert_called_once()
+    session_id, task_definitions = ArmoniKTasks.submit_tasks.call_args.args
+    assert session_id == "sessionid"
+    assert [definition.payload_id for definition in task_definitions] == ["payload-0", "payload-1"]
+    assert task_definitions[0].options.max_duration == timedelta(seconds=15)
+    assert task_definitions[1].data_dependencies == ["output-0"]
+    assert task_definitions[1].options.max_duration == timedelta(minutes=1)
+    assert task_definitions[1].options.options == {"key": "value"}
+
+
+def test_task_create_from_file_single_output(mocker, tmp_path):
+    definitions = tmp_path / "tasks.yaml"
+    definitions.write_text("- payload_id: payload\n  expected_outputs: output\n")
+    mocker.patch.object(ArmoniKTasks, "submit_tasks", return_value=[deepcopy(raw_tasks[0])])
+    run_cmd_and_assert_exit_code(
+        f"task create --endpoint {ENDPOINT} --session-id sessionid --from-file {definitions}"
+    )
+    _, task_definitions = ArmoniKTasks.submit_tasks.call_args.args
+    assert task_definitions[0].expected_output_ids == ["output"]
+
+
+@pytest.mark.parametrize(
+    "args, missing",
+    [
+        ("--payload-id payloadid", "Missing option '--expected-outputs'"),
+        ("--expected-outputs 1", "Missing option '--payload-id'"),
+    ],
+)
+def test_task_create_missing_option(args, missing):
+    result = run_cmd_and_assert_exit_code(
+        f"task create --endpoint {ENDPOINT} --session-id sessionid {args}", exit_code=2
+    )
+    assert missing in result.output
+
+
+@pytest.mark.parametrize(
+    "content, extra_args, message",
+    [
+        (
+            "- payload_id: payload\n  expected_outputs: [output]\n",
+            "--payload-id payload",
+            "cannot be used together",
+        ),
+        ("- payload_id: payload\n  unknown: value\n", "", "unknown fields: unknown"),
+        ("payload_id: payload\n", "", "non-empty list of task definitions"),
+        ("- [payload]\n", "", "Task definition 0 isn't a mapping"),
+        (
+            "- payload_id: payload\n  expected_outputs: {output: id}\n",
+            "",
+            "Task definition 0 has an invalid expected_outputs",
+        ),
+        (
+            "- payload_id: payload\n  data_dependencies: [1]\n  expected_outputs: out\n",
+            "",
+            "Task definition 0 has an invalid data_dependencies",
+        ),
+        ("- expected_outputs: [output]\n", "", "Task definition 0 needs a payload_id"),
+        ("- payload_id: payload\n", "", "Task definition 0 needs at least one expected output"),
+        (
+            "- payload_id: payload\n  expected_outputs: out\n"
+            "- payload_id: payload\n  expected_outputs: out\n  priority: high\n",
+            "",
+            "Task definition 1 has an invalid priority",
+        ),
+        (
+            "- payload_id: payload\n  expected_outputs: out\n  max_retries: 1.5\n",
+            "",
+            "Task definition 0 has an invalid max_retries",
+        ),
+        (
+            "- payload_id: payload\n  expected_outputs: out\n  max_duration: 1 hour\n",
+            "",
+            "Task definition 0 has an invalid max_duration",
+        ),
+        (
+            "- payload_id: payload\n  expected_outputs: out\n  options: [key]\n",
+            "",
+            "Task definition 0 has an invalid options",
+        ),
+        (
+            "- payload_id: payload\n  expected_outputs: out\n  partition_id: 3\n",
+            "",
+            "Task definition 0 has an invalid partition_id",
+        ),
+    ],
+)
+def test_task_create_from_invalid_file(mocker, tmp_path, content, extra_args, message):
+    definitions = tmp_path / "tasks.yaml"
+    definitions.write_text(content)
+    mocker.patch.object(ArmoniKTasks, "submit_tasks", return_value=[])
+    result = run_cmd_and_assert_exit_code(
+        f"task create --endpoint {ENDPOINT} --session-id sessionid --from-file {definitions} "
+        f"{extra_args}",
+        exit_code=2,
+    )
+    # The error panel wraps the message over several bordered lines
+    assert message in " ".join(result.output.replace("│", "").split())
+    ArmoniKTasks.submit_tasks.assert_not_called()
+
+
+def test_lookup_tasks_batches(mocker):
+    task_ids = [f"task-{index}" for index in range(250)]
+    mocker.patch.object(ArmoniKTasks, "list_tasks", return_value=(0, []))
+    mocker.patch.object(ArmoniKTasks, "get_task", side_effect=lambda task_id: f"got {task_id}")
+
+    lookups = lookup_tasks(CliConfig.from_dict({"endpoint": ENDPOINT}), task_ids)
+
+    assert [lookup.result() for lookup in lookups] == [f"got {task_id}" for task_id in task_ids]
+    assert sorted(call.kwargs["page_size"] for call in ArmoniKTasks.list_tasks.call_args_list) == [
+        50,
+        100,
+        100,
+    ]
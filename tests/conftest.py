@@ -1,26 +1,28 @@
 import json
 import logging
 
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from click.testing import CliRunner, Result
 import pytest
 
 from armonik_cli.cli import cli
+from armonik_cli_core.configuration import _get_shared_grpc_channel
+
+_RUNNER = CliRunner()
 
 
 def run_cmd_and_assert_exit_code(
-    cmd: str,
+    cmd: Union[str, List[str]],
     exit_code: int = 0,
     input: Optional[str] = None,
     env: Optional[Dict[str, str]] = None,
     split: bool = True,
 ) -> Result:
-    if split:
+    if split and isinstance(cmd, str):
         cmd = cmd.split()
-    runner = CliRunner()
-    with runner.isolated_filesystem():
-        result = runner.invoke(cli, cmd, input=input, env=env)
+    with _RUNNER.isolated_filesystem():
+        result = _RUNNER.invoke(cli, cmd, input=input, env=env)
         # Debugging: Print the result details
         print(f"Command: {cmd}")
         print(f"Result Output: {result.output}")
@@ -49,3 +51,11 @@ def disable_logging():
     logging.disable(logging.CRITICAL)  # This disables all logs below CRITICAL level
     yield
     logging.disable(logging.NOTSET)  # Re-enable logging after the test
+
+
+@pytest.fixture(autouse=True)
+def reset_grpc_channels():
+    """Drop the shared gRPC channels so that channel mocks don't leak between tests."""
+    _get_shared_grpc_channel.cache_clear()
+    yield
+    _get_shared_grpc_channel.cache_clear()
@@ -0,0 +1,44 @@
+import rich_click as click
+
+from armonik_cli_core.utils import get_command_paths_with_options, get_config_option_names
+
+
+@click.group(name="root")
+@click.option("-v", "--verbose", is_flag=True)
+def root(**kwargs):
+    pass
+
+
+@root.group(name="sub")
+def sub(**kwargs):
+    pass
+
+
+@sub.command(name="leaf")
+@click.argument("name")
+@click.option("-n", "--number", type=int)
+@click.option("--flag/--no-flag")
+def leaf(**kwargs):
+    pass
+
+
+def test_get_command_paths_with_options():
+    assert get_command_paths_with_options(root) == {
+        "root": ["--verbose"],
+        "root sub": [],
+        "root sub leaf": ["--number", "--flag"],
+    }
+
+
+def test_get_command_paths_with_options_parent():
+    assert get_command_paths_with_options(sub, "root") == {
+        "root sub": [],
+        "root sub leaf": ["--number", "--flag"],
+    }
+
+
+def test_get_config_option_names():
+    common_options, cluster_options, excluded_options = get_config_option_names()
+    assert common_options[:3] == ("--help", "--config", "--version")
+    assert "--endpoint" in cluster_options
+    assert excluded_options == frozenset(common_options + cluster_options)
@@ -0,0 +1,57 @@
+import pytest
+import rich_click as click
+
+from click.testing import CliRunner
+
+from armonik_cli_core.commands import EnrichedCommand
+from armonik_cli_core.options import MutuallyExclusiveOption
+
+
+@click.command(cls=EnrichedCommand)
+@click.option("--first", required=True)
+@click.option("--second", required=True)
+@click.option("--third", required=True, envvar="TEST_THIRD")
+@click.option("--fourth", required=False)
+def enriched(**kwargs):
+    click.echo("ok")
+
+
+@pytest.mark.parametrize(
+    ("args", "env", "missing"),
+    [
+        ([], {}, "Missing required options: '--first', '--second', '--third'"),
+        (["--second", "b"], {}, "Missing required options: '--first', '--third'"),
+        (["--second", "b"], {"TEST_THIRD": "c"}, "Missing required option: '--first'"),
+    ],
+)
+def test_enriched_command_missing_params(args, env, missing):
+    result = CliRunner().invoke(enriched, args, env=env)
+    assert result.exit_code == 2
+    assert missing in result.output
+
+
+def test_enriched_command_keeps_required():
+    result = CliRunner().invoke(enriched, ["--first", "a", "--second", "b", "--third", "c"])
+    assert result.exit_code == 0
+    assert [param.required for param in enriched.params] == [True, True, True, False]
+
+
+@click.command(cls=EnrichedCommand)
+@click.option("--first", required=True)
+@click.option("--second", required=True, cls=MutuallyExclusiveOption, mutual=["from_file"])
+@click.option("--from-file", cls=MutuallyExclusiveOption, mutual=["second"])
+def enriched_mutual(**kwargs):
+    click.echo("ok")
+
+
+@pytest.mark.parametrize(
+    ("args", "missing"),
+    [
+        ([], "Missing required options: '--first', '--second'"),
+        (["--from-file", "f"], "Missing required option: '--first'"),
+    ],
+)
+def test_enriched_command_missing_mutually_exclusive_params(args, missing):
+    result = CliRunner().invoke(enriched_mutual, args)
+    assert result.exit_code == 2
+    assert missing in result.output
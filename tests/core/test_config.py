@@ -5,7 +5,13 @@ import os
 
 from unittest.mock import patch
 from pathlib import Path
-from armonik_cli_core.configuration import CliConfig
+from armonik_cli_core.configuration import (
+    GRPC_CHANNEL_POOL_SIZE,
+    CliConfig,
+    get_cli_config,
+    get_grpc_channel,
+    get_grpc_channels,
+)
 
 
 @pytest.fixture
@@ -51,6 +57,14 @@ def test_default_config_loading(temp_config_dir):
     assert config.output == "auto"
 
 
+def test_default_config_written_in_missing_directory(tmp_path):
+    """Test that the configuration directory is created when the defaults are first written."""
+    CliConfig.default_path = tmp_path / "armonik_cli" / "config.yml"
+    config = CliConfig()
+    assert config.output == "auto"
+    assert yaml.safe_load(CliConfig.default_path.read_text())["output"] == "auto"
+
+
 def test_config_file_override(default_config_file):
     """Test that config file values override defaults."""
     config = CliConfig()
@@ -155,3 +169,37 @@ def test_empty_additional_config(temp_config_dir, default_config_file):
     empty_config.write_text("")
     loaded_empty_config = CliConfig.from_file(empty_config)
     assert loaded_empty_config._config.model_dump(exclude_unset=True) == {}
+
+
+def test_get_cli_config_cached(default_config_file):
+    """Test that the default configuration is only read again after being written."""
+    config = get_cli_config()
+    assert get_cli_config() is config
+    assert config.endpoint == "default-endpoint"
+
+    CliConfig().set(endpoint="new-endpoint")
+    new_config = get_cli_config()
+    assert new_config is not config
+    assert new_config.endpoint == "new-endpoint"
+
+
+def test_get_grpc_channel_shared():
+    """Test that the same channel is returned for the same connection settings."""
+    config = CliConfig.from_dict({"endpoint": "localhost:5001"})
+    other_config = CliConfig.from_dict({"endpoint": "localhost:5002"})
+
+    channel = get_grpc_channel(config)
+    assert get_grpc_channel(CliConfig.from_dict({"endpoint": "localhost:5001"})) is channel
+    assert get_grpc_channel(other_config) is not channel
+
+
+def test_get_grpc_channels_pool():
+    """Test that a pool holds distinct channels, the first one being the shared channel."""
+    config = CliConfig.from_dict({"endpoint": "localhost:5001"})
+
+    channels = get_grpc_channels(config, 10)
+    assert len(channels) == GRPC_CHANNEL_POOL_SIZE
+    assert len(set(map(id, channels))) == GRPC_CHANNEL_POOL_SIZE
+    assert channels[0] is get_grpc_channel(config)
+    assert get_grpc_channels(config, 2) == channels[:2]
+    assert len(get_grpc_channels(config, 0)) == 1
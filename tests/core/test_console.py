@@ -0,0 +1,51 @@
+import json
+import pytest
+import yaml
+
+from armonik_cli_core.console import ArmoniKCLIConsole
+
+
+@pytest.mark.parametrize("print_format", ["json", "yaml", "table"])
+@pytest.mark.parametrize(
+    "objs",
+    [[], [{"Name": "a", "Value": 1}], [{"Name": "a", "Value": 1}, {"Name": "b", "Value": 2}]],
+)
+def test_formatted_print_iterator(print_format, objs):
+    def render(obj):
+        console = ArmoniKCLIConsole(record=True, width=120)
+        console.formatted_print(
+            obj, print_format=print_format, table_cols=[("Name", "Name"), ("Value", "Value")]
+        )
+        return console.export_text()
+
+    assert render(iter(objs)) == render(objs)
+
+
+@pytest.mark.parametrize(
+    ("table_cols", "expected"),
+    [
+        ([("Name", "Name")], ["Name", "a", "b"]),
+        ([("Value", "Value"), ("Name", "Name")], ["Value  Name", "1      a", "2      b"]),
+    ],
+)
+def test_formatted_print_table(table_cols, expected):
+    console = ArmoniKCLIConsole(record=True, width=120)
+    console.formatted_print(
+        [{"Name": "a", "Value": 1}, {"Name": "b", "Value": 2}],
+        print_format="table",
+        table_cols=table_cols,
+    )
+    assert [line.strip() for line in console.export_text().splitlines()] == expected
+
+
+@pytest.mark.parametrize("print_format", ["json", "yaml"])
+def test_formatted_print_document_unaltered(print_format):
+    obj = {"Type": "Literal[json, yaml]", "Description": " ".join(["word"] * 40)}
+    console = ArmoniKCLIConsole(record=True, width=40)
+    console.formatted_print(obj, print_format=print_format)
+    output = console.export_text()
+
+    if print_format == "json":
+        assert json.loads(output) == obj
+    else:
+        assert yaml.safe_load(output) == obj
@@ -199,3 +199,9 @@ from armonik_cli_core.filters import FilterParser
 )
 def test_filter_parser(args, expr, filter):
     assert FilterParser(*args).parse(expr).to_dict() == filter.to_dict()
+
+
+def test_filter_parser_shared_grammar():
+    session_parser = FilterParser(Session, SessionFilter, SessionStatus)
+    task_parser = FilterParser(Task, TaskFilter, TaskStatus)
+    assert session_parser.get_parser() is task_parser.get_parser()
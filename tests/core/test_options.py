@@ -103,6 +103,36 @@ def test_require_one_mutual_exclusion(cli_mutually_exclusive_require_one_option)
     assert "Illegal usage: `alpha` cannot be used together with 'beta'" in result.output
 
 
+@pytest.fixture(scope="module")
+def cli_mutually_exclusive_required_option():
+    @click.command()
+    @click.option(
+        "--alpha", cls=MutuallyExclusiveOption, mutual=["beta"], required=True, help="Option alpha."
+    )
+    @click.option("--beta", cls=MutuallyExclusiveOption, mutual=["alpha"], help="Option beta.")
+    def cli_required(alpha, beta):
+        click.echo(f"alpha={alpha}, beta={beta}")
+
+    return cli_required
+
+
+@pytest.mark.parametrize(
+    ("args", "exit_code", "output"),
+    [
+        ([], 2, "Missing option '--alpha'"),
+        (["--alpha", "value1"], 0, "alpha=value1, beta=None"),
+        (["--beta", "value2"], 0, "alpha=None, beta=value2"),
+    ],
+)
+def test_required_unless_mutual(cli_mutually_exclusive_required_option, args, exit_code, output):
+    runner = CliRunner()
+    result = runner.invoke(cli_mutually_exclusive_required_option, args)
+    assert result.exit_code == exit_code
+    assert output in result.output
+    # The option stays required for the next invocations
+    assert cli_mutually_exclusive_required_option.params[0].required
+
+
 def test_global_option_at_group_level(cli_global_option):
     runner = CliRunner()
     result = runner.invoke(cli_global_option, ["--foo", "value1", "--bar", "value2", "command"])
@@ -6,6 +6,7 @@ from datetime import timedelta, datetime
 
 from armonik.common import Session, TaskOptions, SessionStatus, Task, TaskStatus, Partition
 
+from armonik_cli_core.exceptions import ArmoniKCLIError
 from armonik_cli_core.serialize import serialize
 
 
@@ -37,6 +38,20 @@ def test_primitive_types():
     assert serialize(None) is None
 
 
+def test_primitive_subclasses():
+    """Test that subclasses of primitive types are serialized like their base type"""
+
+    class MyStr(str):
+        pass
+
+    class MyDict(dict):
+        pass
+
+    assert serialize(MyStr("test")) == "test"
+    assert serialize(MyDict(key=MyEnum.FIRST)) == {"key": "First"}
+    assert serialize(b"bytes") == b"bytes"
+
+
 def test_datetime():
     """Test serialization of datetime objects"""
     assert serialize(datetime(2024, 1, 1, 12, 0)) == "2024-01-01 12:00:00"
@@ -61,6 +76,12 @@ def test_dict():
     assert serialize(test_dict) == {"time": "2024-01-01 12:00:00", "enum": "First"}
 
 
+def test_dict_non_string_key():
+    """Test that dicts with non-string keys are rejected"""
+    with pytest.raises(ArmoniKCLIError):
+        serialize({"key": "value", 1: "value"})
+
+
 def test_nested_list():
     """Test serialization of nested lists"""
     nested_list = [1, ["a", "b"], {"key": "value"}]
@@ -329,3 +350,10 @@ def test_serializer_success_task(raw_input, serialized_output):
 def test_serializer_success_partition(raw_input, serialized_output):
     """Test serialization for Partition objects."""
     assert serialize(raw_input) == serialized_output
+
+
+def test_same_class_objects():
+    """Test that objects of an already serialized class are serialized the same way"""
+    objs = [RegularClass(title="first", count=1), RegularClass(title="second", count=2)]
+    assert serialize(objs) == [{"Title": "first", "Count": 1}, {"Title": "second", "Count": 2}]
+    assert serialize(objs[1]) == {"Title": "second", "Count": 2}
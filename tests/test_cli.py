@@ -1,5 +1,8 @@
 import pytest
 
+from click import exceptions as click_exceptions
+
+from armonik_cli.commands import LAZY_SUBCOMMANDS
 from conftest import run_cmd_and_assert_exit_code
 
 
@@ -11,3 +14,43 @@ def test_armonik_version():
 @pytest.mark.parametrize("flag", ["--help", "-h"])
 def test_armonik_help(flag):
     run_cmd_and_assert_exit_code(flag)
+
+
+def test_armonik_lazy_subcommands():
+    from armonik_cli.cli import cli
+
+    assert set(LAZY_SUBCOMMANDS).issubset(cli.list_commands(None))
+    for name in LAZY_SUBCOMMANDS:
+        command = cli.get_command(None, name)
+        assert command is not None
+        assert command.name == name
+
+
+def test_armonik_help_populates_option_groups():
+    import rich_click
+
+    run_cmd_and_assert_exit_code("--help")
+    assert [group["name"] for group in rich_click.rich_click.OPTION_GROUPS["armonik"]] == [
+        "Common options",
+        "Cluster connection options",
+        "Command-specific options",
+    ]
+
+
+def test_armonik_command_modules():
+    import types
+
+    import armonik_cli.commands.sessions as sessions_module
+
+    assert isinstance(sessions_module, types.ModuleType)
+    assert sessions_module.sessions.name == "session"
+
+
+@pytest.mark.skipif(
+    not hasattr(click_exceptions, "NoSuchCommand"),
+    reason="Click only suggests command names from version 8.4",
+)
+def test_armonik_suggests_lazy_subcommands():
+    result = run_cmd_and_assert_exit_code("sesion", exit_code=2)
+    assert "No such command 'sesion'" in result.output
+    assert "'session'" in result.output
@@ -1,8 +1,20 @@
+import mmap
 import pytest
+import threading
 
 from datetime import timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Union
 
-from armonik_cli.utils import parse_time_delta, remove_string_delimiters
+from armonik_cli.utils import (
+    fetch_all_pages,
+    iter_all_pages,
+    lookup_by_ids,
+    map_file,
+    parse_time_delta,
+    pretty_type,
+    remove_string_delimiters,
+)
 
 
 @pytest.mark.parametrize(
@@ -30,3 +42,95 @@ def test_parse_time_delta(input, output):
 )
 def test_remove_string_delimiters(input, output):
     remove_string_delimiters(input) == output
+
+
+@pytest.mark.parametrize(
+    ("input", "output"),
+    [
+        (int, "int"),
+        (Optional[Path], "Path"),
+        (Optional[Union[int, str]], "Union[int, str]"),
+        (List[int], "list[int]"),
+        (Dict[str, Optional[int]], "dict[str, int]"),
+    ],
+)
+def test_pretty_type(input, output):
+    assert pretty_type(input) == output
+    assert pretty_type(input) is pretty_type(input)
+
+
+@pytest.mark.parametrize(("content", "mapped"), [(b"file content", True), (b"", False)])
+def test_map_file(tmp_path, content, mapped):
+    file_path = tmp_path / "data.bin"
+    file_path.write_bytes(content)
+    with open(file_path, "rb") as file, map_file(file) as data:
+        assert isinstance(data, mmap.mmap) is mapped
+        assert data[:] == content
+
+
+@pytest.mark.parametrize(
+    ("total", "page_size", "page_count"), [(0, 2, 1), (1, 2, 1), (2, 2, 1), (5, 2, 3)]
+)
+def test_fetch_all_pages(total, page_size, page_count):
+    items = list(range(total))
+    requested_pages = []
+
+    def list_page(page):
+        requested_pages.append(page)
+        return total, items[page * page_size : (page + 1) * page_size]
+
+    assert fetch_all_pages(list_page, page_size) == items
+    assert sorted(requested_pages) == list(range(page_count))
+
+    requested_pages.clear()
+    count, page_items = iter_all_pages(list_page, page_size)
+    assert count == total
+    assert requested_pages == [0]
+    assert list(page_items) == items
+    assert sorted(requested_pages) == list(range(page_count))
+
+
+def test_iter_all_pages_bounded_prefetch():
+    page_size, page_count, max_workers = 2, 20, 3
+    items = list(range(page_size * page_count))
+    requested_pages = []
+    lock = threading.Lock()
+
+    def list_page(page):
+        with lock:
+            requested_pages.append(page)
+        return len(items), items[page * page_size : (page + 1) * page_size]
+
+    _, page_items = iter_all_pages(list_page, page_size, max_workers)
+    assert [next(page_items) for _ in range(page_size * 2)] == items[: page_size * 2]
+    page_items.close()
+    assert len(requested_pages) <= 2 + max_workers
+
+
+def test_lookup_by_ids():
+    class Item:
+        def __init__(self, item_id):
+            self.item_id = item_id
+
+    listed_batches = []
+
+    def list_batch(index, batch):
+        listed_batches.append(batch)
+        return [Item(item_id) for item_id in batch if item_id != "missing"]
+
+    def get_item(index, item_id):
+        raise KeyError(item_id)
+
+    ids = ["id-0", "missing", "id-1", "id-2", "id-0"]
+    lookups = lookup_by_ids(ids, list_batch, get_item, "item_id", batch_size=2)
+
+    assert sorted(listed_batches) == [["id-0", "missing"], ["id-1", "id-2"]]
+    assert [lookups[index].result().item_id for index in (0, 2, 3, 4)] == [
+        "id-0",
+        "id-1",
+        "id-2",
+        "id-0",
+    ]
+    with pytest.raises(KeyError):
+        lookups[1].result()
+    assert lookup_by_ids([], list_batch, get_item, "item_id") == []